@@ -1,48 +1,93 @@
 import argparse
 import os
+import sys
 import time
 import tracemalloc
 from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
 from text_to_vocabulary.storage.ods_exporter import export_storage_to_single_file
 from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
 
-def build_dataset(per_category: int, duplicate_rate: float) -> dict[str, list[str]]:
-    dataset = {}
+
+def iter_category_words(category: str, per_category: int, dup_count: int) -> Iterator[str]:
+    for index in range(per_category):
+        yield f"{category}_word_{index}"
+    for index in range(min(dup_count, per_category)):
+        yield f"{category}_word_{index}"
+
+
+def build_dataset(per_category: int, duplicate_rate: float) -> dict[str, Iterator[str]]:
     dup_count = max(int(per_category * duplicate_rate), 0)
-    for category in LEXICAL_CATEGORIES:
-        words = [f"{category}_word_{index}" for index in range(per_category)]
-        if dup_count:
-            words.extend(words[:dup_count])
-        dataset[category] = words
-    return dataset
+    return {
+        category: iter_category_words(category, per_category, dup_count)
+        for category in LEXICAL_CATEGORIES
+    }
 
 
-def run_merge(storage: SQLiteVocabularyStorage, dataset: dict[str, list[str]]) -> None:
-    total_words = sum(len(words) for words in dataset.values())
+def run_merge(storage: SQLiteVocabularyStorage, dataset: dict[str, Iterable[str]]) -> None:
+    total_words = 0
+
+    def counting(words: Iterable[str]) -> Iterator[str]:
+        nonlocal total_words
+        for word in words:
+            total_words += 1
+            yield word
+
     start = time.perf_counter()
-    counts = storage.merge_categories(dataset, source="perf")
+    counts = storage.merge_categories(
+        {category: counting(words) for category, words in dataset.items()},
+        source="perf",
+    )
     elapsed = time.perf_counter() - start
     added = sum(counts.values())
     rate = added / elapsed if elapsed else 0.0
     print(f"Merge: {added}/{total_words} added in {elapsed:.3f}s ({rate:.1f} words/s)")
 
 
-def run_export(storage: SQLiteVocabularyStorage, export_path: str) -> None:
-    os.makedirs(os.path.dirname(export_path) or ".", exist_ok=True)
-    tracemalloc.start()
-    tracemalloc.reset_peak()
+def _max_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_export(
+    storage: SQLiteVocabularyStorage, export_path: str, *, detailed_memory: bool = False
+) -> None:
+    export_file = Path(export_path)
+    export_file.parent.mkdir(parents=True, exist_ok=True)
+    if detailed_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    rss_before = _max_rss_bytes()
     start = time.perf_counter()
-    export_storage_to_single_file(storage, export_path)
+    export_storage_to_single_file(storage, str(export_file))
     elapsed = time.perf_counter() - start
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    size_bytes = os.path.getsize(export_path)
+    rss_after = _max_rss_bytes()
+    size_bytes = export_file.stat().st_size
     size_mb = size_bytes / (1024 * 1024)
-    peak_mb = peak / (1024 * 1024)
-    print(f"Export: {elapsed:.3f}s, peak tracemalloc {peak_mb:.1f} MiB, file {size_mb:.1f} MiB")
+
+    if detailed_memory:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = f"peak tracemalloc {peak / (1024 * 1024):.1f} MiB"
+    elif rss_before is None:
+        memory = "peak RSS unavailable"
+    else:
+        growth_mb = (rss_after - rss_before) / (1024 * 1024)
+        memory = (
+            f"peak RSS {rss_after / (1024 * 1024):.1f} MiB (+{growth_mb:.1f} MiB)"
+        )
+    print(f"Export: {elapsed:.3f}s, {memory}, file {size_mb:.1f} MiB")
 
 
 def main() -> int:
@@ -64,6 +109,11 @@ def main() -> int:
     parser.add_argument("--db-path", type=str, default="")
     parser.add_argument("--export-path", type=str, default="")
     parser.add_argument("--skip-export", action="store_true")
+    parser.add_argument(
+        "--detailed-memory",
+        action="store_true",
+        help="Trace allocations with tracemalloc (slows the export down).",
+    )
 
     args = parser.parse_args()
     if args.per_category <= 0:
@@ -86,7 +136,7 @@ def main() -> int:
     run_merge(storage, dataset)
 
     if not args.skip_export:
-        run_export(storage, export_path)
+        run_export(storage, export_path, detailed_memory=args.detailed_memory)
         print(f"Export file: {export_path}")
 
     return 0
@@ -1,5 +1,7 @@
 import sqlite3
 
+import pytest
+
 from text_to_vocabulary.db_manager import DatabaseManager
 
 
@@ -61,6 +63,10 @@ def test_db_manager_crud_and_sql(tmp_path):
         modify = manager.execute_sql("UPDATE items SET qty = qty + 1")
         assert modify["kind"] == "modify"
         assert modify["rowcount"] == 2
+        assert modify["schema_changed"] is False
+        assert manager.execute_sql("CREATE TABLE extra (id INTEGER)")["schema_changed"]
+        assert manager.execute_sql("-- add\nCREATE TABLE other (id INTEGER)")["schema_changed"]
+        assert "other" in manager.list_tables()
     finally:
         manager.close()
 
@@ -101,3 +107,234 @@ def test_db_manager_rowid_fallback(tmp_path):
         assert deleted == 1
     finally:
         manager.close()
+
+
+def test_db_manager_schema_cache_refreshes_after_ddl(tmp_path):
+    db_path = tmp_path / "schema.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        info = manager.get_table_info("items")
+        assert manager.get_table_info("items") is info
+
+        manager.execute_sql("ALTER TABLE items ADD COLUMN qty INTEGER")
+        assert manager.get_table_columns("items") == ["id", "name", "qty"]
+    finally:
+        manager.close()
+
+
+def test_db_manager_insert_rows_batches(tmp_path):
+    db_path = tmp_path / "batch.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        inserted = manager.insert_rows(
+            "items",
+            [{"id": None, "name": "Apple"}, {"name": "Banana"}],
+        )
+        assert inserted == 2
+        assert manager.insert_rows("items", []) == 0
+
+        schema = manager.get_table_schema("items")
+        assert schema.columns == ("id", "name")
+        assert schema.integer_pk == "id"
+        assert manager.insert_row("items", {"name": "Date"}, schema=schema) == 3
+
+        with pytest.raises(sqlite3.IntegrityError):
+            manager.insert_rows("items", [{"name": "Cherry"}, {"name": None}])
+
+        result = manager.execute_sql("SELECT id, name FROM items ORDER BY id")
+        assert [tuple(row) for row in result["rows"]] == [(1, "Apple"), (2, "Banana"), (3, "Date")]
+    finally:
+        manager.close()
+
+
+def test_db_manager_opens_in_wal_mode(tmp_path):
+    db_path = tmp_path / "items.db"
+    sqlite3.connect(db_path).close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        assert manager.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert manager.connection.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        manager.close()
+
+
+def test_db_manager_reads_while_writer_is_busy(tmp_path):
+    db_path = tmp_path / "items.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO items (name) VALUES ('Apple')")
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        with manager.writer() as writer:
+            writer.execute("INSERT INTO items (name) VALUES ('Banana')")
+            assert manager.count_rows("items") == 1
+            _columns, rows = manager.fetch_rows("items", limit=10, offset=0)
+            assert rows[0]["name"] == "Apple"
+        assert manager.count_rows("items") == 2
+
+        with manager.reader() as reader:
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM items")
+    finally:
+        manager.close()
+
+
+def test_db_manager_keyset_pages_and_cached_count(tmp_path):
+    db_path = tmp_path / "items.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [(f"item{i}",) for i in range(10)])
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        assert manager.count_rows("items") == 10
+        assert manager.count_rows("items") == 10
+        manager.delete_row("items", manager.get_row_identifier("items"), 1)
+        assert manager.count_rows("items") == 9
+
+        external = sqlite3.connect(db_path)
+        external.execute("DELETE FROM items WHERE id = 2")
+        external.commit()
+        external.close()
+        assert manager.count_rows("items") == 8
+
+        _columns, rows = manager.fetch_rows("items", limit=3, offset=0, order_by="id", after=5)
+        assert [row["id"] for row in rows] == [6, 7, 8]
+        _columns, rows = manager.fetch_rows("items", limit=3, offset=0, order_by="id", before=6)
+        assert [row["id"] for row in rows] == [3, 4, 5]
+        with pytest.raises(ValueError):
+            manager.fetch_rows("items", limit=3, offset=0, after=5)
+    finally:
+        manager.close()
+
+
+def test_db_manager_schema_cache_follows_external_ddl(tmp_path):
+    db_path = tmp_path / "schema.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        manager.sync_schema_cache()
+        info = manager.get_table_info("items")
+        manager.sync_schema_cache()
+        assert manager.get_table_info("items") is info
+
+        conn.execute("ALTER TABLE items ADD COLUMN qty INTEGER")
+        conn.commit()
+        manager.sync_schema_cache()
+        assert manager.get_table_columns("items") == ["id", "name", "qty"]
+    finally:
+        conn.close()
+        manager.close()
+
+
+def test_db_manager_execute_sql_pages_select(tmp_path):
+    db_path = tmp_path / "items.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)")
+    conn.executemany(
+        "INSERT INTO items (name, qty) VALUES (?, ?)", [(f"item{i}", i + 1) for i in range(10)]
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        result = manager.execute_sql("SELECT name FROM items ORDER BY id", page_size=4)
+        assert [row[0] for row in result["rows"]] == ["item0", "item1", "item2", "item3"]
+        cursor = result["cursor"]
+        assert cursor is not None
+
+        assert len(manager.fetch_more(cursor, 4)) == 4
+        assert [row[0] for row in manager.fetch_more(cursor, 4)] == ["item8", "item9"]
+        assert manager.fetch_more(cursor, 4) == []
+
+        single = manager.execute_sql("SELECT name FROM items WHERE qty = 1", page_size=4)
+        assert single["rowcount"] == 1
+        assert single["cursor"] is None
+    finally:
+        manager.close()
+
+
+def test_db_manager_delete_rows_in_one_transaction(tmp_path):
+    db_path = tmp_path / "items.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [(f"item{i}",) for i in range(5)])
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        identifier = manager.get_row_identifier("items")
+        assert manager.delete_rows("items", identifier, [1, 3, 99]) == 2
+        assert manager.count_rows("items") == 3
+
+        with pytest.raises(sqlite3.Error):
+            manager.delete_rows("items", identifier, [2, object()])
+        assert manager.count_rows("items") == 3
+    finally:
+        manager.close()
+
+
+def test_db_manager_fetch_row_by_identifier(tmp_path):
+    db_path = tmp_path / "logs.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE logs (message TEXT NOT NULL, level INTEGER)")
+    conn.executemany("INSERT INTO logs VALUES (?, ?)", [("start", 1), ("stop", 2)])
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    try:
+        identifier = manager.get_row_identifier("logs")
+        row = manager.fetch_row("logs", identifier, 2)
+        assert (row["message"], row["level"]) == ("stop", 2)
+        assert manager.fetch_row("logs", identifier, 3) is None
+    finally:
+        manager.close()
+
+
+def test_db_manager_writes_after_external_commit_with_paged_select(tmp_path):
+    db_path = tmp_path / "items.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [(f"item{i}",) for i in range(10)])
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    other = sqlite3.connect(db_path)
+    try:
+        result = manager.execute_sql("SELECT name FROM items ORDER BY id", page_size=4)
+        assert result["cursor"] is not None
+
+        other.execute("INSERT INTO items (name) VALUES ('external')")
+        other.commit()
+
+        manager.insert_row("items", {"name": "editor"})
+        assert manager.fetch_more(result["cursor"], 4) == []
+        modify = manager.execute_sql("DELETE FROM items WHERE name = 'external'")
+        assert modify["rowcount"] == 1
+        assert manager.count_rows("items") == 11
+    finally:
+        other.close()
+        manager.close()
@@ -3,12 +3,14 @@ import zipfile
 from xml.etree import ElementTree as ET
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
+from text_to_vocabulary.storage import ods_exporter, ods_vocabulary_store
 from text_to_vocabulary.storage.ods_exporter import (
     export_sqlite_to_ods,
     export_storage_to_single_file,
 )
-from text_to_vocabulary.storage.ods_importer import import_ods_to_sqlite
+from text_to_vocabulary.storage.ods_importer import import_ods_to_sqlite, import_ods_to_storage
 from text_to_vocabulary.storage.ods_vocabulary_store import (
+    NS_OFFICE,
     NS_TABLE,
     NS_TEXT,
     read_words_from_ods,
@@ -107,3 +109,95 @@ def test_export_sqlite_to_ods_single_columns(tmp_path):
     assert rows[1][verb_index] == "run"
     assert rows[2][noun_index] == "dog"
     assert rows[2][verb_index] == ""
+
+
+def test_export_single_file_reports_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(ods_exporter, "EXPORT_PROGRESS_ROWS", 2)
+    storage = SQLiteVocabularyStorage(str(tmp_path / "vocab.db"))
+    storage.add_words("noun", ["ant", "bee", "cat", "dog", "eel"])
+    storage.add_words("verb", ["run"])
+    reported = []
+
+    export_storage_to_single_file(
+        storage, str(tmp_path / "all.ods"), progress=reported.append
+    )
+
+    assert reported == [2, 4, 5]
+
+    storage.add_words("noun", ["fox"])
+    reported.clear()
+    export_storage_to_single_file(
+        storage, str(tmp_path / "all.ods"), progress=reported.append
+    )
+
+    assert reported == [2, 4, 6]
+
+
+def test_import_ods_merges_in_single_call(tmp_path, monkeypatch):
+    input_dir = tmp_path / "legacy"
+    input_dir.mkdir()
+    write_words_to_ods(str(input_dir / "noun.ods"), ["cat"])
+    write_words_to_ods(str(input_dir / "verb.ods"), ["run"])
+    (input_dir / "adverb.txt").write_text("fast\n", encoding="utf-8")
+
+    storage = SQLiteVocabularyStorage(str(tmp_path / "vocab.db"))
+    calls = []
+    original = storage.merge_categories
+
+    def tracking_merge(category_word_map, source=None):
+        calls.append(sorted(category_word_map))
+        return original(category_word_map, source=source)
+
+    monkeypatch.setattr(storage, "merge_categories", tracking_merge)
+    report = import_ods_to_storage(str(input_dir), storage)
+
+    assert calls == [["adverb", "noun", "verb"]]
+    assert report["total_added"] == 3
+
+
+_CONTENT_XML_SAMPLE = f"""<?xml version="1.0" encoding="utf-8"?>
+<office:document-content xmlns:office="{NS_OFFICE}" xmlns:table="{NS_TABLE}" xmlns:text="{NS_TEXT}">
+<office:body><office:spreadsheet><table:table>
+<table:table-row><table:table-cell><text:p>a<text:span>b</text:span></text:p><text:p>c</text:p></table:table-cell><table:table-cell><text:p>skip</text:p></table:table-cell></table:table-row>
+<table:table-row><table:covered-table-cell/><table:table-cell>raw &amp; text</table:table-cell></table:table-row>
+<table:table-row><table:table-cell><text:p> </text:p></table:table-cell></table:table-row>
+<table:table-row/>
+</table:table></office:spreadsheet></office:body></office:document-content>
+""".encode("utf-8")
+
+
+def test_iter_words_from_ods_reads_first_cell_text(tmp_path):
+    path = tmp_path / "sample.ods"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("content.xml", _CONTENT_XML_SAMPLE)
+
+    assert list(ods_vocabulary_store.iter_words_from_ods(str(path))) == ["ab\nc", "raw & text"]
+
+
+def test_import_ods_reports_unique_words(tmp_path):
+    input_dir = tmp_path / "legacy"
+    input_dir.mkdir()
+    write_words_to_ods(str(input_dir / "noun.ods"), ["Cat", "dog", "cat", "Dog"])
+
+    storage = SQLiteVocabularyStorage(str(tmp_path / "vocab.db"))
+    report = import_ods_to_storage(str(input_dir), storage)
+
+    assert report["categories"]["noun"]["input_count"] == 4
+    assert report["categories"]["noun"]["unique_imported"] == 2
+    assert storage.get_words("noun") == ["Cat", "dog"]
+
+
+def test_write_words_to_ods_compression_levels(tmp_path):
+    words = [f"word{index}" for index in range(200)]
+    stored_path = tmp_path / "stored.ods"
+    deflated_path = tmp_path / "deflated.ods"
+    write_words_to_ods(str(stored_path), words, compresslevel=0)
+    write_words_to_ods(str(deflated_path), words)
+
+    with zipfile.ZipFile(stored_path) as archive:
+        assert archive.getinfo("content.xml").compress_type == zipfile.ZIP_STORED
+    with zipfile.ZipFile(deflated_path) as archive:
+        assert archive.getinfo("content.xml").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+    assert read_words_from_ods(str(stored_path)) == words
+    assert read_words_from_ods(str(deflated_path)) == words
@@ -1,10 +1,19 @@
+import sqlite3
+
+import pytest
+
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
+from text_to_vocabulary.storage import sqlite_vocabulary_storage
 from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
 
 
+def _fast_storage(db_path):
+    return SQLiteVocabularyStorage(str(db_path), journal_mode="MEMORY", synchronous="OFF")
+
+
 def test_sqlite_storage_add_and_get(tmp_path):
     db_path = tmp_path / "vocab.db"
-    storage = SQLiteVocabularyStorage(str(db_path))
+    storage = _fast_storage(db_path)
 
     assert set(storage.get_categories()) == set(LEXICAL_CATEGORIES)
 
@@ -20,10 +29,195 @@ def test_sqlite_storage_add_and_get(tmp_path):
 
 def test_sqlite_storage_merge_words(tmp_path):
     db_path = tmp_path / "vocab.db"
-    storage = SQLiteVocabularyStorage(str(db_path))
+    storage = _fast_storage(db_path)
 
     added = storage.merge_words("verb", ["Run"])
     assert added == 1
 
     added = storage.merge_words("verb", ["run"])
     assert added == 0
+
+
+def test_sqlite_storage_merge_categories_counts(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    storage.add_words("noun", ["cat"])
+
+    counts = storage.merge_categories(
+        {"noun": ["Cat", "dog", "dog"], "verb": ["run", "walk"], "adverb": []},
+        source="llm",
+    )
+    assert counts == {"noun": 1, "verb": 2, "adverb": 0}
+    assert storage.get_words("noun") == ["cat", "dog"]
+
+    counts = storage.merge_categories({"noun": ["dog"], "verb": ["Run"]})
+    assert counts == {"noun": 0, "verb": 0}
+
+
+def test_sqlite_storage_default_pragmas(tmp_path):
+    storage = SQLiteVocabularyStorage(str(tmp_path / "vocab.db"))
+    with storage._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_sqlite_storage_merge_backfills_source(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    storage.add_words("noun", ["Cat", "dog"])
+
+    added = storage.merge_words("noun", ["cat", "bird"], source="llm")
+    assert added == 1
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT cw.surface_form, cw.source
+            FROM category_words cw
+            ORDER BY cw.id
+            """
+        ).fetchall()
+    assert rows == [("Cat", "llm"), ("dog", None), ("bird", "llm")]
+
+
+def test_sqlite_storage_known_lemmas_follow_external_deletes(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    assert storage.merge_words("noun", ["cat", "dog"], source="llm") == 2
+    assert storage.merge_words("noun", ["cat", "dog"], source="llm") == 0
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "DELETE FROM category_words WHERE word_id = "
+            "(SELECT id FROM words WHERE lemma = 'cat')"
+        )
+
+    assert storage.merge_words("noun", ["cat", "dog"], source="llm") == 1
+    assert storage.get_words("noun") == ["cat", "dog"]
+
+
+def test_sqlite_storage_reuses_connection(tmp_path):
+    storage = _fast_storage(tmp_path / "vocab.db")
+    conn = storage._connect()
+
+    storage.add_words("noun", ["cat"])
+    assert storage.get_words("noun") == ["cat"]
+    assert storage._connect() is conn
+
+    storage.close()
+    assert storage._conn is None
+    assert storage.get_words("noun") == ["cat"]
+    storage.close()
+
+
+def test_sqlite_storage_merge_spans_stage_chunks(tmp_path):
+    storage = _fast_storage(tmp_path / "vocab.db")
+    words = [f"Word{index}" for index in range(450)] + ["word0", "WORD1"]
+
+    assert storage.merge_words("noun", words, source="llm") == 450
+    stored = storage.get_words("noun")
+    assert len(stored) == 450
+    assert "Word0" in stored and "word0" not in stored
+
+
+def test_sqlite_storage_bulk_merge_rebuilds_fts(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_vocabulary_storage, "FTS_BULK_REBUILD_MIN_ROWS", 2)
+    storage = _fast_storage(tmp_path / "vocab.db")
+    if not storage._fts_available:
+        pytest.skip("FTS5 unavailable")
+
+    storage.merge_categories({"noun": ["Cat", "catalog", "dog"], "verb": ["run"]})
+    storage.add_words("noun", ["cattle"])
+
+    assert storage.get_words("noun", search="cat") == ["Cat", "catalog", "cattle"]
+    triggers = {
+        row[0]
+        for row in storage._connect().execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        )
+    }
+    assert set(sqlite_vocabulary_storage.FTS_DEFERRED_TRIGGERS) <= triggers
+
+
+def test_sqlite_storage_short_search_matches_prefix(tmp_path):
+    storage = _fast_storage(tmp_path / "vocab.db")
+    storage.add_words("noun", ["Cat", "scar", "car", "dog", "Éclair"])
+
+    assert storage.get_words("noun", search="c") == ["car", "Cat"]
+    assert storage.get_words("noun", search="é") == ["Éclair"]
+
+
+def test_sqlite_storage_is_empty_tracks_external_deletes(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    assert storage.is_empty()
+
+    storage.add_words("noun", ["cat"])
+    assert storage._nonempty_version is not None
+    assert not storage.is_empty()
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM category_words")
+    assert storage.is_empty()
+
+
+def test_sqlite_storage_substring_search_uses_trigram_index(tmp_path):
+    storage = _fast_storage(tmp_path / "vocab.db")
+    storage.add_words("noun", ["X-ray", "x-rays", "ray", "ice cream", "Ice-cream"])
+
+    assert storage.get_words("noun", search="x-ray") == ["X-ray", "x-rays"]
+    assert storage.get_words("noun", search="e cr") == ["ice cream"]
+    if storage._trigram_available:
+        with sqlite3.connect(tmp_path / "vocab.db") as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(1) FROM words_trigram WHERE words_trigram MATCH '\"-ray\"'"
+            ).fetchone()
+        assert count == 2
+
+
+def test_sqlite_storage_add_words_does_not_mark_lemmas_known(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    storage.merge_words("noun", ["dog"], source="llm")
+    storage.add_words("noun", ["cat"])
+    storage.add_words("noun", ["cat"], source="x")
+
+    storage.merge_words("noun", ["cat"], source="llm")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT surface_form, source FROM category_words ORDER BY id"
+        ).fetchall()
+    assert rows == [("dog", "llm"), ("cat", "llm")]
+
+
+def test_sqlite_storage_known_lemmas_follow_external_updates(tmp_path):
+    db_path = tmp_path / "vocab.db"
+    storage = _fast_storage(db_path)
+    storage.merge_words("noun", ["cat", "dog"], source="llm")
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE category_words SET source = NULL")
+
+    assert storage.merge_words("noun", ["cat"], source="llm") == 0
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT surface_form, source FROM category_words ORDER BY id").fetchall()
+    assert rows == [("cat", "llm"), ("dog", None)]
+
+
+def test_sqlite_storage_fallback_search_matches_token_prefixes(tmp_path):
+    storage = _fast_storage(tmp_path / "vocab.db")
+    storage.add_words("noun", ["Cream", "ice cream", "give up", "upset", "cup", "snake_case"])
+
+    expected = {
+        "cream": ["Cream", "ice cream"],
+        "up": ["give up", "upset"],
+        "c": ["Cream", "cup", "ice cream"],
+        "snake_": ["snake_case"],
+    }
+    for fts_available in (True, False):
+        storage._fts_available = fts_available
+        for search, words in expected.items():
+            assert sorted(storage.get_words("noun", search=search), key=str.lower) == sorted(
+                words, key=str.lower
+            ), (fts_available, search)
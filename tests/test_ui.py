@@ -3,10 +3,20 @@ import tkinter as tk
 
 import pytest
 
+from text_to_vocabulary.app import vocabulary_analysis
 from text_to_vocabulary.domain import vocabulary as domain
 from text_to_vocabulary.ui import tk_main_window as ui
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _require_tk():
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        pytest.skip(f"Tkinter unavailable: {exc}")
+    root.destroy()
+
+
 def _stub_settings(tmp_path):
     return {
         "endpoint": "http://127.0.0.1:1234/v1/chat/completions",
@@ -22,10 +32,7 @@ def _stub_settings(tmp_path):
 
 def _create_app(monkeypatch, tmp_path):
     monkeypatch.setattr(ui, "load_settings", lambda: _stub_settings(tmp_path))
-    try:
-        return ui.VocabularyWindow()
-    except tk.TclError as exc:
-        pytest.skip(f"Tkinter unavailable: {exc}")
+    return ui.VocabularyWindow()
 
 
 def test_app_defaults(monkeypatch, tmp_path):
@@ -65,7 +72,7 @@ def test_run_request_success(monkeypatch, tmp_path):
     ):
         return data, added_counts, data["table"], None
 
-    monkeypatch.setattr(ui, "analyze_and_store", fake_analyze_and_store)
+    monkeypatch.setattr(vocabulary_analysis, "analyze_and_store", fake_analyze_and_store)
 
     app._run_request("hello", str(tmp_path))
     app.update()
@@ -100,7 +107,7 @@ def test_run_request_error(monkeypatch, tmp_path):
     ):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(ui, "analyze_and_store", fake_analyze_and_store)
+    monkeypatch.setattr(vocabulary_analysis, "analyze_and_store", fake_analyze_and_store)
 
     app._run_request("hello", str(tmp_path))
     app.update()
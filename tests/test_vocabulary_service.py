@@ -1,9 +1,15 @@
 import json
+import sqlite3
+import zipfile
 
 from text_to_vocabulary import config
+from text_to_vocabulary.app import vocabulary_analysis
 from text_to_vocabulary.domain import vocabulary as domain
-from text_to_vocabulary.integrations import llm_client
+from text_to_vocabulary.integrations import llm_cache, llm_client
+from text_to_vocabulary.integrations.llm_cache import LLMResponseCache
 from text_to_vocabulary.storage import ods_vocabulary_store as store
+from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
+from text_to_vocabulary.storage.vocabulary_cache import VocabularyCache
 
 
 def test_dedupe_preserve_order_strips():
@@ -26,6 +32,12 @@ def test_extract_json_embedded():
     assert data["noun"] == ["cat"]
 
 
+def test_extract_json_skips_prose_braces():
+    content = 'Sure {not json}: {"noun": ["cat"], "note": "a}b{"} done'
+    data = llm_client.extract_json(content)
+    assert data == {"noun": ["cat"], "note": "a}b{"}
+
+
 def test_extract_json_missing():
     try:
         llm_client.extract_json("no json here")
@@ -52,6 +64,12 @@ def test_format_table_uses_dash_for_empty():
     assert "| verb | - |" in lines
 
 
+def test_format_table_reuses_cached_output():
+    first = domain.format_markdown_table({"noun": ["cat"], "verb": ["run"]})
+    second = domain.format_markdown_table({"verb": ["run"], "noun": ["cat"]})
+    assert first is second
+
+
 def test_ods_roundtrip(tmp_path):
     path = tmp_path / "words.ods"
     words = ["cat", "take off"]
@@ -60,6 +78,14 @@ def test_ods_roundtrip(tmp_path):
     assert store.read_words_from_ods(str(path)) == words
 
 
+def test_ods_roundtrip_escapes_markup(tmp_path):
+    path = tmp_path / "words.ods"
+    words = ["rock & roll", "a < b", "<tag>", "\"quoted\""]
+
+    store.write_words_to_ods(str(path), words)
+    assert store.read_words_from_ods(str(path)) == words
+
+
 def test_normalize_endpoint():
     assert (
         llm_client.normalize_endpoint("http://127.0.0.1:1234")
@@ -157,6 +183,37 @@ def test_request_analysis_default_model_and_messages(monkeypatch):
     assert result["table"] == domain.format_markdown_table(result)
 
 
+def test_request_analysis_cache_ignores_whitespace(monkeypatch):
+    calls = []
+
+    def fake_post_json(url, payload, timeout=90):
+        calls.append(payload)
+        return json.dumps({"choices": [{"message": {"content": '{"noun": ["cat"]}'}}]})
+
+    class DictCache:
+        def __init__(self):
+            self.entries = {}
+
+        def get(self, key):
+            return self.entries.get(key)
+
+        def set(self, key, value):
+            self.entries[key] = value
+
+    monkeypatch.setattr(llm_client, "_post_json", fake_post_json)
+    cache = DictCache()
+
+    first = llm_client.request_vocabulary_analysis(
+        "http://127.0.0.1:1234", "model-x", "The cat\nsat.", cache=cache
+    )
+    second = llm_client.request_vocabulary_analysis(
+        "http://127.0.0.1:1234", "model-x", "  The  cat sat.\n", cache=cache
+    )
+
+    assert len(calls) == 1
+    assert second == first
+
+
 def test_write_vocabulary_exports_appends_missing(tmp_path):
     output_dir = tmp_path / "data"
     data = {"noun": ["cat", "dog", "cat"], "verb": ["run"]}
@@ -192,6 +249,18 @@ def test_append_missing_words_handles_existing(tmp_path):
     assert store.read_words_from_ods(str(path)) == ["cat", "dog", "bird"]
 
 
+def test_append_missing_words_adds_repeated_input_once(tmp_path):
+    ods_path = tmp_path / "noun.ods"
+    txt_path = tmp_path / "verb.txt"
+    store.write_words_to_ods(str(ods_path), [" cat "])
+    txt_path.write_text("run\n", encoding="utf-8")
+
+    assert store.append_missing_words(str(ods_path), ["dog", " dog", "cat", None]) == 1
+    assert store.read_words_from_ods(str(ods_path)) == ["cat", "dog"]
+    assert store.append_missing_words(str(txt_path), ["walk", "walk ", "run"]) == 1
+    assert store.read_words_from_txt(str(txt_path)) == ["run", "walk"]
+
+
 def test_append_missing_words_migrates_from_txt(tmp_path):
     txt_path = tmp_path / "noun.txt"
     txt_path.write_text("cat\ndog\n", encoding="utf-8")
@@ -201,3 +270,195 @@ def test_append_missing_words_migrates_from_txt(tmp_path):
     assert count == 1
     assert ods_path.exists()
     assert store.read_words_from_ods(str(ods_path)) == ["cat", "dog", "bird"]
+
+
+def test_append_missing_words_reuses_cached_rows(tmp_path):
+    path = str(tmp_path / "noun.ods")
+    store.write_words_to_ods(path, ["cat"])
+    cache = VocabularyCache()
+
+    assert store.append_missing_words(path, ["dog & co"], cache=cache) == 1
+    assert cache.get_rows_xml(path) is not None
+    assert cache.get_word_set(path) == {"cat", "dog & co"}
+    assert store.append_missing_words(path, ["bird", "cat"], cache=cache) == 1
+
+    expected = ["cat", "dog & co", "bird"]
+    assert store.read_words_from_ods(path) == expected
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("content.xml") == store.build_content_xml(expected)
+
+
+def test_vocabulary_cache_reuses_stat_within_ttl(tmp_path):
+    path = tmp_path / "noun.txt"
+    path.write_text("cat", encoding="utf-8")
+    calls = []
+
+    def loader(target):
+        calls.append(target)
+        return store.read_words_from_txt(target)
+
+    cache = VocabularyCache(stat_ttl=60)
+    assert cache.get_words(str(path), loader) == ("cat",)
+    path.write_text("cat\ndog", encoding="utf-8")
+    assert cache.get_words(str(path), loader) == ("cat",)
+
+    cache = VocabularyCache(stat_ttl=0)
+    assert cache.get_words(str(path), loader) == ("cat", "dog")
+    path.write_text("cat", encoding="utf-8")
+    assert cache.get_words(str(path), loader) == ("cat",)
+    assert len(calls) == 3
+
+
+def test_vocabulary_cache_persists_between_instances(tmp_path):
+    path = tmp_path / "noun.txt"
+    path.write_text("cat", encoding="utf-8")
+    persist_to = str(tmp_path / "cache.pickle")
+    calls = []
+
+    def loader(target):
+        calls.append(target)
+        return store.read_words_from_txt(target)
+
+    cache = VocabularyCache(persist_to=persist_to)
+    assert cache.get_words(str(path), loader) == ("cat",)
+    cache.save()
+
+    assert VocabularyCache(persist_to=persist_to).get_words(str(path), loader) == ("cat",)
+    assert len(calls) == 1
+
+    path.write_text("cat\ndog", encoding="utf-8")
+    assert VocabularyCache(persist_to=persist_to).get_words(str(path), loader) == (
+        "cat",
+        "dog",
+    )
+    assert len(calls) == 2
+
+
+def test_load_settings_reloads_after_file_change(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"model": "first"}), encoding="utf-8")
+    config.clear_settings_cache()
+
+    first = config.load_settings(str(settings_path))
+    first["model"] = "mutated"
+    assert config.load_settings(str(settings_path))["model"] == "first"
+
+    settings_path.write_text(json.dumps({"model": "second-model"}), encoding="utf-8")
+    assert config.load_settings(str(settings_path))["model"] == "second-model"
+
+
+def test_analyze_and_store_reuses_last_analysis(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_request(endpoint, model, text, **_kwargs):
+        calls.append(text)
+        return {"noun": ["cat"], "table": "table"}
+
+    monkeypatch.setattr(vocabulary_analysis, "request_vocabulary_analysis", fake_request)
+    monkeypatch.setattr(vocabulary_analysis, "_LAST_ANALYSIS", {})
+    storage = SQLiteVocabularyStorage(str(tmp_path / "vocab.db"))
+    options = {
+        "endpoint": "http://127.0.0.1:1234",
+        "model": "model-x",
+        "output_dir": str(tmp_path),
+        "storage": storage,
+        "auto_import_ods": False,
+        "cache": LLMResponseCache(str(tmp_path / "cache.db")),
+    }
+
+    first, first_counts, _table, _report = vocabulary_analysis.analyze_and_store(
+        "The cat.", **options
+    )
+    first["noun"] = ["mutated"]
+    second, second_counts, _table, _report = vocabulary_analysis.analyze_and_store(
+        "The cat.", **options
+    )
+    vocabulary_analysis.analyze_and_store("A dog.", **options)
+
+    assert calls == ["The cat.", "A dog."]
+    assert second["noun"] == ["cat"]
+    assert first_counts["noun"] == 1
+    assert second_counts["noun"] == 0
+
+    options["cache"] = None
+    vocabulary_analysis.analyze_and_store("A dog.", **options)
+    vocabulary_analysis.analyze_and_store("A dog.", **options)
+    assert calls == ["The cat.", "A dog.", "A dog.", "A dog."]
+
+
+def test_llm_cache_expires_entries_past_ttl(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = LLMResponseCache(db_path, ttl_seconds=60)
+    cache.set("fresh", {"noun": ["cat"]})
+    cache.set("stale", {"noun": ["dog"]})
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE llm_cache SET created_at = datetime('now', '-1 hour') "
+            "WHERE cache_key = 'stale'"
+        )
+
+    assert cache.get("fresh") == {"noun": ["cat"]}
+    assert cache.get("stale") is None
+
+    LLMResponseCache(db_path, ttl_seconds=60)
+    with sqlite3.connect(db_path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT cache_key FROM llm_cache")]
+    assert keys == ["fresh"]
+
+
+def test_llm_cache_reuses_connection_in_wal_mode(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "cache.db"))
+    cache.set("key", {"noun": ["cat"]})
+    conn = cache._conn
+    assert cache.get("key") == {"noun": ["cat"]}
+    assert cache._conn is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    cache.close()
+    assert cache._conn is None
+    assert cache.get("key") == {"noun": ["cat"]}
+
+
+def test_llm_cache_prunes_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "PRUNE_INTERVAL", 3)
+    cache = LLMResponseCache(str(tmp_path / "cache.db"), max_entries=1)
+
+    def count():
+        return cache._conn.execute("SELECT COUNT(1) FROM llm_cache").fetchone()[0]
+
+    cache.set("a", {"noun": ["a"]})
+    cache.set("b", {"noun": ["b"]})
+    assert count() == 2
+    cache.set("c", {"noun": ["c"]})
+    assert count() == 1
+
+    cache.set("d", {"noun": ["d"]})
+    cache.flush()
+    assert count() == 1
+
+
+def test_apply_title_rules_detects_titles_in_text():
+    result = {"noun": ["mr", "cat"], "title": []}
+    llm_client._apply_title_rules(result, "Mr. Smith met MRS Jones and Mrsomething.")
+    assert result["noun"] == ["cat"]
+    assert result["title"] == ["mr.", "mrs."]
+
+
+def test_build_fields_cache_key_separates_fields():
+    key = llm_cache.build_fields_cache_key
+    assert key("ab", "c") != key("a", "bc")
+    assert key(None) != key("None")
+    assert key(1, 0.2) == key(1, 0.2)
+
+
+def test_encode_chat_payload_matches_json():
+    payload = {
+        "model": "model-x",
+        "messages": [
+            {"role": "system", "content": 'PROMPT "quoted"\n'},
+            {"role": "user", "content": "TEXT:\nHello"},
+        ],
+        "temperature": 0.2,
+        "max_tokens": 100,
+    }
+    assert json.loads(llm_client._encode_chat_payload(payload)) == payload
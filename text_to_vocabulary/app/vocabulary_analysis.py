@@ -7,6 +7,8 @@ from text_to_vocabulary.storage.ods_exporter import (
 from text_to_vocabulary.storage.ods_importer import import_ods_to_storage
 from text_to_vocabulary.storage.vocabulary_storage import VocabularyStorage
 
+_LAST_ANALYSIS = {}
+
 
 def analyze_and_store(
     text,
@@ -23,17 +25,37 @@ def analyze_and_store(
     auto_import_ods=True,
     cache=None,
 ):
-    analysis = request_vocabulary_analysis(
+    # Repeated submits of the same text skip the LLM round trip; storage is
+    # still merged so added counts reflect the current database. Without a
+    # response cache every submit asks the model again.
+    request_key = (
         endpoint,
         model,
+        temperature,
+        system_prompt,
+        context_limit,
+        max_output_tokens,
+        token_safety_margin,
         text,
-        temperature=temperature,
-        system_prompt=system_prompt,
-        context_limit=context_limit,
-        max_output_tokens=max_output_tokens,
-        token_safety_margin=token_safety_margin,
-        cache=cache,
+        cache,
     )
+    analysis = _LAST_ANALYSIS.get(request_key) if cache is not None else None
+    if analysis is None:
+        analysis = request_vocabulary_analysis(
+            endpoint,
+            model,
+            text,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            context_limit=context_limit,
+            max_output_tokens=max_output_tokens,
+            token_safety_margin=token_safety_margin,
+            cache=cache,
+        )
+        _LAST_ANALYSIS.clear()
+        if cache is not None:
+            _LAST_ANALYSIS[request_key] = analysis
+    analysis = dict(analysis)
     if not isinstance(storage, VocabularyStorage):
         raise TypeError("storage must implement VocabularyStorage")
 
@@ -42,13 +64,7 @@ def analyze_and_store(
         migration_report = import_ods_to_storage(output_dir, storage)
 
     category_words = {category: analysis.get(category, []) for category in LEXICAL_CATEGORIES}
-    bulk_merge = getattr(storage, "merge_categories", None)
-    if callable(bulk_merge):
-        added_counts = bulk_merge(category_words, source="llm")
-    else:
-        added_counts = {}
-        for category, words in category_words.items():
-            added_counts[category] = storage.merge_words(category, words, source="llm")
+    added_counts = storage.merge_categories(category_words, source="llm")
 
     table = analysis.get("table") or format_markdown_table(analysis)
     return analysis, added_counts, table, migration_report
@@ -90,12 +106,12 @@ def export_multiple_files(*, storage, output_dir):
     return result, message
 
 
-def export_single_file(*, storage, file_path):
+def export_single_file(*, storage, file_path, progress=None):
     if not isinstance(storage, VocabularyStorage):
         raise TypeError("storage must implement VocabularyStorage")
     if storage.is_empty():
         raise ValueError("No vocabulary data to export.")
 
-    result = export_storage_to_single_file(storage, file_path)
+    result = export_storage_to_single_file(storage, file_path, progress=progress)
     message = f"Exported file to {file_path}"
     return result, message
@@ -1,6 +1,13 @@
 import json
 import os
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 SETTINGS_FILENAME = "settings.json"
 DEFAULT_OUTPUT_DIRNAME = "exports"
@@ -9,6 +16,9 @@ DEFAULT_MAX_OUTPUT_TOKENS = 16000
 DEFAULT_TOKEN_SAFETY_MARGIN = 200
 DEFAULT_LLM_CACHE_ENABLED = True
 DEFAULT_LLM_CACHE_MAX_ENTRIES = 500
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_SETTINGS_CACHE = {}
 
 DEFAULT_SYSTEM_PROMPT = """You are a linguistic analysis assistant.
 
@@ -89,6 +99,7 @@ DEFAULT_SETTINGS = {
     "auto_import_ods": True,
     "llm_cache_enabled": DEFAULT_LLM_CACHE_ENABLED,
     "llm_cache_max_entries": DEFAULT_LLM_CACHE_MAX_ENTRIES,
+    "llm_cache_ttl_seconds": DEFAULT_LLM_CACHE_TTL_SECONDS,
 }
 
 
@@ -132,18 +143,36 @@ def get_default_settings_path(cwd=None):
     return os.path.join(base, SETTINGS_FILENAME)
 
 
+def clear_settings_cache():
+    _SETTINGS_CACHE.clear()
+
+
 def load_settings(path=None):
-    path = path or get_default_settings_path()
-    if not os.path.exists(path):
+    path = os.path.abspath(path or get_default_settings_path())
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        _SETTINGS_CACHE.pop(path, None)
         raise FileNotFoundError(
             f"Missing settings.json at '{path}'. Create a settings.json file with "
             "keys: endpoint, model, temperature, context_limit, max_output_tokens, "
             "token_safety_margin, system_prompt, db_path."
-        )
+        ) from None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    settings = _read_settings(path)
+    _SETTINGS_CACHE[path] = (signature, settings)
+    return dict(settings)
 
+
+def _read_settings(path):
     settings = dict(DEFAULT_SETTINGS)
     with open(path, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
+        data = _json_loads(handle.read())
     if isinstance(data, dict):
         settings["endpoint"] = _coerce_str(data.get("endpoint"), settings["endpoint"])
         settings["model"] = _coerce_str(data.get("model"), settings["model"])
@@ -186,6 +215,11 @@ def load_settings(path=None):
             settings["llm_cache_max_entries"],
             minimum=0,
         )
+        settings["llm_cache_ttl_seconds"] = _coerce_int(
+            data.get("llm_cache_ttl_seconds"),
+            settings["llm_cache_ttl_seconds"],
+            minimum=0,
+        )
 
     return settings
 
@@ -1,6 +1,10 @@
 import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Iterator
 
 
 def quote_identifier(name: str) -> str:
@@ -15,51 +19,229 @@ class RowIdentifier:
     is_rowid_alias: bool = False
 
 
+@dataclass(frozen=True)
+class TableSchema:
+    quoted_table: str
+    columns: tuple[str, ...]
+    integer_pk: str | None
+    insert_sql: str
+    auto_pk_columns: tuple[str, ...]
+    auto_pk_insert_sql: str | None
+
+
+def _build_insert_sql(quoted_table: str, columns) -> str:
+    if not columns:
+        return f"INSERT INTO {quoted_table} DEFAULT VALUES"
+    placeholders = ", ".join(["?"] * len(columns))
+    quoted_cols = ", ".join(quote_identifier(col) for col in columns)
+    return f"INSERT INTO {quoted_table} ({quoted_cols}) VALUES ({placeholders})"
+
+
+# Same settings the vocabulary storage uses, so browsing the editor's pages
+# doesn't block the app writing to the same file.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA busy_timeout = 5000",
+)
+
+READER_POOL_SIZE = 3
+STATEMENT_CACHE_SIZE = 256
+
+_READ_PREFIXES = ("select", "pragma", "with", "explain")
+
+
+def _build_fetch_sql(table, columns, include_rowid, order_by, mode) -> str:
+    select_cols = [quote_identifier(col) for col in columns]
+    if include_rowid:
+        select_cols.insert(0, "rowid AS __rowid__")
+    sql = f"SELECT {', '.join(select_cols)} FROM {quote_identifier(table)}"
+    if mode == "after":
+        return f"{sql} WHERE {order_by} > ? ORDER BY {order_by} LIMIT ?"
+    if mode == "before":
+        return f"{sql} WHERE {order_by} < ? ORDER BY {order_by} DESC LIMIT ?"
+    if order_by:
+        sql = f"{sql} ORDER BY {order_by}"
+    return f"{sql} LIMIT ? OFFSET ?"
+
+
 class DatabaseManager:
     def __init__(self, db_path: str):
         self.db_path = None
         self.connection = None
+        self._write_lock = threading.RLock()
+        self._reader_lock = threading.Lock()
+        # LIFO so single-threaded paging keeps reusing the same reader, whose
+        # data_version then validates the row-count cache.
+        self._idle_readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_connections: list[sqlite3.Connection] = []
+        self._table_info_cache: dict[str, list[dict]] = {}
+        self._row_identifier_cache: dict[str, RowIdentifier | None] = {}
+        self._schema_cache: dict[str, TableSchema] = {}
+        self._count_cache: dict[str, tuple[sqlite3.Connection, int, int]] = {}
+        self._fetch_sql_cache: dict[tuple, str] = {}
+        self._schema_version: int | None = None
+        self._result_cursor: sqlite3.Cursor | None = None
         self.open(db_path)
 
     def open(self, db_path: str) -> None:
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"Database file not found: {db_path}")
         self.close()
-        self.connection = sqlite3.connect(db_path)
+        self.clear_schema_cache()
+        self.connection = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            self.connection.execute(pragma)
         self.connection.row_factory = sqlite3.Row
         self.db_path = db_path
 
     def close(self) -> None:
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        with self._reader_lock:
+            for conn in self._reader_connections:
+                conn.close()
+            self._reader_connections = []
+            self._idle_readers = queue.LifoQueue()
+        with self._write_lock:
+            self._result_cursor = None
+            if self.connection:
+                self.connection.close()
+                self.connection = None
 
-    def list_tables(self) -> list[str]:
-        cursor = self.connection.execute(
-            "SELECT name FROM sqlite_master "
-            "WHERE type='table' AND name NOT LIKE 'sqlite_%' "
-            "ORDER BY name"
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
         )
-        return [row[0] for row in cursor.fetchall()]
+        for pragma in CONNECTION_PRAGMAS[1:]:
+            conn.execute(pragma)
+        conn.execute("PRAGMA query_only = 1")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        # Paging and schema reads use up to READER_POOL_SIZE query-only
+        # connections, so in WAL mode they never wait behind the writer.
+        with self._reader_lock:
+            idle = self._idle_readers
+            conn = None
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                if len(self._reader_connections) < READER_POOL_SIZE:
+                    conn = self._open_reader()
+                    self._reader_connections.append(conn)
+        if conn is None:
+            conn = idle.get()
+        try:
+            yield conn
+        finally:
+            idle.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            conn = self.connection
+            if not conn.in_transaction:
+                self._release_result_cursor()
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def clear_schema_cache(self) -> None:
+        self._table_info_cache.clear()
+        self._row_identifier_cache.clear()
+        self._schema_cache.clear()
+        self._count_cache.clear()
+        self._fetch_sql_cache.clear()
+        self._schema_version = None
+
+    def sync_schema_cache(self) -> None:
+        # The schema caches already survive page turns; this only drops them
+        # when some connection, possibly another process, changed the schema.
+        with self.reader() as conn:
+            (version,) = conn.execute("PRAGMA schema_version").fetchone()
+        if version != self._schema_version:
+            self.clear_schema_cache()
+            self._schema_version = version
+
+    @staticmethod
+    def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    def list_tables(self) -> list[str]:
+        with self.reader() as conn:
+            cursor = self._tuple_cursor(conn).execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name NOT LIKE 'sqlite_%' "
+                "ORDER BY name"
+            )
+            return [row[0] for row in cursor]
 
     def get_table_info(self, table: str) -> list[dict]:
-        cursor = self.connection.execute(f"PRAGMA table_info({quote_identifier(table)})")
-        return [dict(row) for row in cursor.fetchall()]
+        cached = self._table_info_cache.get(table)
+        if cached is not None:
+            return cached
+        with self.reader() as conn:
+            cursor = conn.execute(f"PRAGMA table_info({quote_identifier(table)})")
+            table_info = [dict(row) for row in cursor.fetchall()]
+        self._table_info_cache[table] = table_info
+        return table_info
 
     def get_table_columns(self, table: str) -> list[str]:
         return [col["name"] for col in self.get_table_info(table)]
 
-    def table_has_rowid(self, table: str) -> bool:
-        cursor = self.connection.execute(
-            "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
-            (table,),
+    def get_table_schema(self, table: str) -> TableSchema:
+        schema = self._schema_cache.get(table)
+        if schema is not None:
+            return schema
+        table_info = self.get_table_info(table)
+        columns = tuple(col["name"] for col in table_info)
+        integer_pk = self._integer_pk_column(table_info)
+        quoted_table = quote_identifier(table)
+        auto_pk_columns = tuple(col for col in columns if col != integer_pk)
+        auto_pk_insert_sql = None
+        if integer_pk is not None:
+            auto_pk_insert_sql = _build_insert_sql(quoted_table, auto_pk_columns)
+        schema = TableSchema(
+            quoted_table=quoted_table,
+            columns=columns,
+            integer_pk=integer_pk,
+            insert_sql=_build_insert_sql(quoted_table, columns),
+            auto_pk_columns=auto_pk_columns,
+            auto_pk_insert_sql=auto_pk_insert_sql,
         )
-        row = cursor.fetchone()
+        self._schema_cache[table] = schema
+        return schema
+
+    def table_has_rowid(self, table: str) -> bool:
+        with self.reader() as conn:
+            cursor = self._tuple_cursor(conn).execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                (table,),
+            )
+            row = cursor.fetchone()
         if not row or row[0] is None:
             return True
         return "WITHOUT ROWID" not in row[0].upper()
 
     def get_row_identifier(self, table: str) -> RowIdentifier | None:
+        if table in self._row_identifier_cache:
+            return self._row_identifier_cache[table]
+        identifier = self._resolve_row_identifier(table)
+        self._row_identifier_cache[table] = identifier
+        return identifier
+
+    def _resolve_row_identifier(self, table: str) -> RowIdentifier | None:
         table_info = self.get_table_info(table)
         pk_cols = [col for col in table_info if col["pk"]]
         if len(pk_cols) == 1:
@@ -76,10 +258,20 @@ class DatabaseManager:
         return None
 
     def count_rows(self, table: str) -> int:
-        cursor = self.connection.execute(
-            f"SELECT COUNT(*) FROM {quote_identifier(table)}"
-        )
-        return int(cursor.fetchone()[0])
+        # PRAGMA data_version on a connection changes whenever another one,
+        # including our writer, commits; until then the last count still holds.
+        with self.reader() as conn:
+            (version,) = conn.execute("PRAGMA data_version").fetchone()
+            cached = self._count_cache.get(table)
+            if cached is not None and cached[0] is conn and cached[1] == version:
+                return cached[2]
+            cursor = self._tuple_cursor(conn).execute(
+                f"SELECT COUNT(*) FROM {quote_identifier(table)}"
+            )
+            (count,) = cursor.fetchone()
+        count = int(count)
+        self._count_cache[table] = (conn, version, count)
+        return count
 
     def fetch_rows(
         self,
@@ -89,62 +281,104 @@ class DatabaseManager:
         *,
         include_rowid: bool = False,
         order_by: str | None = None,
+        after=None,
+        before=None,
     ) -> tuple[list[str], list[sqlite3.Row]]:
+        # after/before are order_by values of a neighbouring page's last/first
+        # row; the page is then found with an index seek instead of OFFSET.
+        if (after is not None or before is not None) and not order_by:
+            raise ValueError("Keyset pagination requires order_by")
         columns = self.get_table_columns(table)
-        select_cols = [quote_identifier(col) for col in columns]
-        if include_rowid:
-            select_cols.insert(0, "rowid AS __rowid__")
-        sql = f"SELECT {', '.join(select_cols)} FROM {quote_identifier(table)}"
-        if order_by:
-            sql = f"{sql} ORDER BY {order_by}"
-        sql = f"{sql} LIMIT ? OFFSET ?"
-        cursor = self.connection.execute(sql, (limit, offset))
-        return columns, cursor.fetchall()
-
-    def insert_row(self, table: str, values_by_column: dict) -> int:
-        table_info = self.get_table_info(table)
-        columns = [col["name"] for col in table_info]
-        integer_pk = None
+        if after is not None:
+            mode, params = "after", (after, limit)
+        elif before is not None:
+            mode, params = "before", (before, limit)
+        else:
+            mode, params = "offset", (limit, offset)
+        # Built once per table and mode; the identical text then also hits
+        # sqlite3's per-connection prepared statement cache.
+        key = (table, include_rowid, order_by, mode)
+        sql = self._fetch_sql_cache.get(key)
+        if sql is None:
+            sql = _build_fetch_sql(table, columns, include_rowid, order_by, mode)
+            self._fetch_sql_cache[key] = sql
+        # Fetched before the reader goes back to the pool; a page is small.
+        with self.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        if before is not None:
+            rows.reverse()
+        return columns, rows
+
+    def fetch_row(
+        self, table: str, identifier: RowIdentifier, identifier_value
+    ) -> sqlite3.Row | None:
+        columns = self.get_table_columns(table)
+        where_col = "rowid" if identifier.kind == "rowid" else quote_identifier(identifier.column)
+        select_cols = ", ".join(quote_identifier(col) for col in columns)
+        sql = f"SELECT {select_cols} FROM {quote_identifier(table)} WHERE {where_col} = ?"
+        with self.reader() as conn:
+            return conn.execute(sql, (identifier_value,)).fetchone()
+
+    @staticmethod
+    def _integer_pk_column(table_info: list[dict]) -> str | None:
         pk_cols = [col for col in table_info if col["pk"]]
         if len(pk_cols) == 1 and "INT" in (pk_cols[0]["type"] or "").upper():
-            integer_pk = pk_cols[0]["name"]
-
-        insert_cols = []
-        params = []
-        for col in columns:
-            value = values_by_column.get(col)
-            if col == integer_pk and value is None:
-                continue
-            insert_cols.append(col)
-            params.append(value)
+            return pk_cols[0]["name"]
+        return None
 
-        if not insert_cols:
-            cursor = self.connection.execute(
-                f"INSERT INTO {quote_identifier(table)} DEFAULT VALUES"
-            )
-        else:
-            placeholders = ", ".join(["?"] * len(insert_cols))
-            quoted_cols = ", ".join(quote_identifier(col) for col in insert_cols)
-            sql = (
-                f"INSERT INTO {quote_identifier(table)} ({quoted_cols}) "
-                f"VALUES ({placeholders})"
-            )
-            cursor = self.connection.execute(sql, params)
-        self.connection.commit()
+    def insert_row(
+        self,
+        table: str,
+        values_by_column: dict,
+        *,
+        schema: TableSchema | None = None,
+    ) -> int:
+        schema = schema or self.get_table_schema(table)
+        sql, columns = self._insert_statement(
+            schema, values_by_column.get(schema.integer_pk) is None
+        )
+        params = [values_by_column.get(col) for col in columns]
+        with self.writer() as conn:
+            cursor = conn.execute(sql, params)
         return cursor.lastrowid
 
+    def insert_rows(
+        self,
+        table: str,
+        rows: list[dict],
+        *,
+        schema: TableSchema | None = None,
+    ) -> int:
+        if not rows:
+            return 0
+        schema = schema or self.get_table_schema(table)
+        sql, columns = self._insert_statement(
+            schema, all(row.get(schema.integer_pk) is None for row in rows)
+        )
+        params = [[row.get(col) for col in columns] for row in rows]
+        with self.writer() as conn:
+            cursor = conn.executemany(sql, params)
+        return cursor.rowcount
+
+    @staticmethod
+    def _insert_statement(schema: TableSchema, auto_pk: bool) -> tuple[str, tuple[str, ...]]:
+        if schema.integer_pk is None or not auto_pk:
+            return schema.insert_sql, schema.columns
+        return schema.auto_pk_insert_sql, schema.auto_pk_columns
+
     def update_row(
         self,
         table: str,
         values_by_column: dict,
         identifier: RowIdentifier,
         identifier_value,
+        *,
+        schema: TableSchema | None = None,
     ) -> int:
-        table_info = self.get_table_info(table)
-        columns = [col["name"] for col in table_info]
+        schema = schema or self.get_table_schema(table)
         set_cols = []
         params = []
-        for col in columns:
+        for col in schema.columns:
             if identifier.kind == "rowid" and col == identifier.column:
                 continue
             set_cols.append(col)
@@ -152,31 +386,90 @@ class DatabaseManager:
 
         assignments = ", ".join(f"{quote_identifier(col)} = ?" for col in set_cols)
         where_col = "rowid" if identifier.kind == "rowid" else quote_identifier(identifier.column)
-        sql = f"UPDATE {quote_identifier(table)} SET {assignments} WHERE {where_col} = ?"
+        sql = f"UPDATE {schema.quoted_table} SET {assignments} WHERE {where_col} = ?"
         params.append(identifier_value)
-        cursor = self.connection.execute(sql, params)
-        self.connection.commit()
+        with self.writer() as conn:
+            cursor = conn.execute(sql, params)
         return cursor.rowcount
 
     def delete_row(self, table: str, identifier: RowIdentifier, identifier_value) -> int:
+        return self.delete_rows(table, identifier, [identifier_value])
+
+    def delete_rows(self, table: str, identifier: RowIdentifier, identifier_values) -> int:
         where_col = "rowid" if identifier.kind == "rowid" else quote_identifier(identifier.column)
         sql = f"DELETE FROM {quote_identifier(table)} WHERE {where_col} = ?"
-        cursor = self.connection.execute(sql, (identifier_value,))
-        self.connection.commit()
+        with self.writer() as conn:
+            cursor = conn.executemany(sql, [(value,) for value in identifier_values])
         return cursor.rowcount
 
-    def execute_sql(self, sql: str) -> dict:
+    def execute_sql(self, sql: str, *, page_size: int | None = None) -> dict:
+        # Console statements stay on the writer connection so TEMP tables and
+        # session pragmas persist between runs; paging reads use the readers.
+        # With page_size, a SELECT returns its first page and, when more rows
+        # may follow, the open cursor for fetch_more().
         cleaned = sql.strip()
-        cursor = self.connection.cursor()
-        cursor.execute(cleaned)
-        if self._is_read_query(cleaned):
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            return {"kind": "select", "columns": columns, "rows": rows, "rowcount": len(rows)}
-        self.connection.commit()
-        return {"kind": "modify", "rowcount": cursor.rowcount}
+        with self._write_lock:
+            self._release_result_cursor()
+            schema_version = self._writer_schema_version()
+            cursor = self.connection.cursor()
+            cursor.execute(cleaned)
+            if self._is_read_query(cleaned):
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                if page_size is None:
+                    rows = cursor.fetchall()
+                    return {"kind": "select", "columns": columns, "rows": rows, "rowcount": len(rows)}
+                rows = self._fetch_page(cursor, page_size)
+                if len(rows) == page_size:
+                    self._result_cursor = cursor
+                return {
+                    "kind": "select",
+                    "columns": columns,
+                    "rows": rows,
+                    "rowcount": len(rows),
+                    "cursor": self._result_cursor,
+                }
+            self.connection.commit()
+            # Compared rather than guessed from the SQL text, which may start
+            # with a comment.
+            schema_changed = self._writer_schema_version() != schema_version
+        if schema_changed:
+            self.clear_schema_cache()
+        return {"kind": "modify", "rowcount": cursor.rowcount, "schema_changed": schema_changed}
+
+    def _writer_schema_version(self) -> int:
+        (version,) = self._tuple_cursor(self.connection).execute(
+            "PRAGMA schema_version"
+        ).fetchone()
+        return version
+
+    def fetch_more(self, cursor: sqlite3.Cursor, page_size: int) -> list:
+        with self._write_lock:
+            if cursor is not self._result_cursor:
+                return []
+            rows = self._fetch_page(cursor, page_size)
+            if len(rows) < page_size:
+                self._result_cursor = None
+            return rows
+
+    def _release_result_cursor(self) -> None:
+        # A half-read SELECT pins the writer connection to its WAL snapshot,
+        # and BEGIN IMMEDIATE then fails with "database is locked" once any
+        # other connection has committed. Writes end the console result early.
+        if self._result_cursor is not None:
+            self._result_cursor.close()
+            self._result_cursor = None
+
+    @staticmethod
+    def _fetch_page(cursor: sqlite3.Cursor, page_size: int) -> list:
+        rows = cursor.fetchmany(page_size)
+        if len(rows) < page_size:
+            cursor.close()
+        return rows
+
+    @staticmethod
+    def _statement_prefix(sql: str) -> str:
+        return sql.lstrip()[:7].lower()
 
     @staticmethod
     def _is_read_query(sql: str) -> bool:
-        token = sql.lstrip().split(None, 1)[0].lower()
-        return token in {"select", "pragma", "with", "explain"}
+        return DatabaseManager._statement_prefix(sql).startswith(_READ_PREFIXES)
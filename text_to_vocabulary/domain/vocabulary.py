@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 LEXICAL_CATEGORIES = [
     "noun",
     "verb",
@@ -20,27 +22,29 @@ LEXICAL_CATEGORIES = [
 
 
 def dedupe_preserve_order(items):
-    seen = set()
-    result = []
-    for item in items:
-        if item is None:
-            continue
-        if not isinstance(item, str):
-            item = str(item)
-        item = item.strip()
-        if item and item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    cleaned = (
+        (item if isinstance(item, str) else str(item)).strip()
+        for item in items
+        if item is not None
+    )
+    return list(dict.fromkeys(item for item in cleaned if item))
+
+
+_TABLE_TEMPLATE = "| Type | Words |\n| --- | --- |\n" + "\n".join(
+    f"| {key} | {{{key}}} |" for key in LEXICAL_CATEGORIES
+)
 
 
 def format_markdown_table(data):
-    def join_words(words):
-        return ", ".join(words) if words else "-"
-
-    header = "| Type | Words |\n| --- | --- |\n"
-    rows = [
-        f"| {key} | {join_words(data.get(key, []))} |"
-        for key in LEXICAL_CATEGORIES
-    ]
-    return header + "\n".join(rows)
+    frozen = tuple(tuple(data.get(key) or ()) for key in LEXICAL_CATEGORIES)
+    return _format_markdown_table(frozen)
+
+
+@lru_cache(maxsize=128)
+def _format_markdown_table(frozen):
+    return _TABLE_TEMPLATE.format_map(
+        {
+            key: ", ".join(words) if words else "-"
+            for key, words in zip(LEXICAL_CATEGORIES, frozen)
+        }
+    )
@@ -1,9 +1,13 @@
-from text_to_vocabulary.integrations.llm_client import (
-    extract_json,
-    normalize_endpoint,
-    request_vocabulary_analysis,
-)
-from text_to_vocabulary.integrations.token_budget import calculate_max_tokens
+import importlib
+
+# Resolved on first access: llm_client pulls in the HTTP stack, which the UI
+# only needs once a request is sent, not to open its window.
+_EXPORTS = {
+    "extract_json": "text_to_vocabulary.integrations.llm_client",
+    "normalize_endpoint": "text_to_vocabulary.integrations.llm_client",
+    "request_vocabulary_analysis": "text_to_vocabulary.integrations.llm_client",
+    "calculate_max_tokens": "text_to_vocabulary.integrations.token_budget",
+}
 
 __all__ = [
     "extract_json",
@@ -11,3 +15,12 @@ __all__ = [
     "request_vocabulary_analysis",
     "calculate_max_tokens",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,10 @@
-import json
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from functools import lru_cache
 
+from text_to_vocabulary.integrations import json_codec
 
 try:
     import urllib3
@@ -13,14 +15,24 @@ except Exception:  # pragma: no cover - optional dependency
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
+@lru_cache(maxsize=4)
+def _split_url(url: str) -> tuple[str, str]:
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return f"{parts.scheme}://{parts.netloc}", path
+
+
 class HttpClient:
     def __init__(self, *, max_retries: int = 2, backoff: float = 0.4, timeout: int = 90):
         self._max_retries = max_retries
         self._backoff = backoff
         self._timeout = timeout
-        self._pool = None
+        self._retry = None
+        self._host_pools = {}
         if urllib3 is not None:
-            retry = urllib3.Retry(
+            self._retry = urllib3.Retry(
                 total=max_retries,
                 read=max_retries,
                 connect=max_retries,
@@ -29,23 +41,34 @@ class HttpClient:
                 allowed_methods=frozenset(["POST"]),
                 raise_on_status=False,
             )
-            self._pool = urllib3.PoolManager(retries=retry)
 
-    def post_json(self, url: str, payload: dict, *, timeout: int | None = None) -> str:
-        body = json.dumps(payload).encode("utf-8")
+    def _host_pool(self, origin: str):
+        # One keep-alive pool per scheme://host:port, reused for every request.
+        pool = self._host_pools.get(origin)
+        if pool is None:
+            pool = urllib3.connection_from_url(origin, retries=self._retry)
+            self._host_pools[origin] = pool
+        return pool
+
+    def post_json(
+        self, url: str, payload: dict | bytes, *, timeout: int | None = None
+    ) -> bytes:
+        body = payload if isinstance(payload, bytes) else json_codec.dumps(payload)
         headers = {"Content-Type": "application/json"}
         request_timeout = timeout if timeout is not None else self._timeout
 
-        if self._pool is not None:
-            response = self._pool.request(
+        if self._retry is not None:
+            origin, path = _split_url(url)
+            response = self._host_pool(origin).urlopen(
                 "POST",
-                url,
+                path,
                 body=body,
                 headers=headers,
                 timeout=request_timeout,
+                retries=self._retry,
             )
             if 200 <= response.status < 300:
-                return response.data.decode("utf-8")
+                return response.data
             detail = response.data.decode("utf-8", errors="ignore")
             raise RuntimeError(
                 f"Request failed ({response.status}): {detail or response.reason}"
@@ -55,7 +78,7 @@ class HttpClient:
             try:
                 request = urllib.request.Request(url, data=body, headers=headers)
                 with urllib.request.urlopen(request, timeout=request_timeout) as response:
-                    return response.read().decode("utf-8")
+                    return response.read()
             except urllib.error.HTTPError as exc:
                 detail = exc.read().decode("utf-8", errors="ignore")
                 if attempt < self._max_retries and exc.code in RETRY_STATUS_CODES:
@@ -1,12 +1,26 @@
 import hashlib
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
+
+from text_to_vocabulary.integrations import json_codec
+
+try:
+    import blake3
+except Exception:  # pragma: no cover - optional dependency
+    blake3 = None
+
+try:
+    import xxhash
+except Exception:  # pragma: no cover - optional dependency
+    xxhash = None
 
 
 CACHE_SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS llm_cache (
     cache_key TEXT PRIMARY KEY,
-    response_json TEXT NOT NULL,
+    response_json BLOB NOT NULL,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     last_accessed TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     hit_count INTEGER NOT NULL DEFAULT 0
@@ -14,89 +28,190 @@ CREATE TABLE IF NOT EXISTS llm_cache (
 
 CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed
     ON llm_cache(last_accessed);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at
+    ON llm_cache(created_at);
+"""
+
+
+CACHE_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA mmap_size = 67108864",
+)
+
+
+PRUNE_INTERVAL = 64
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# ?2 is the datetime() modifier for the TTL cutoff, or NULL when entries never expire.
+_FRESH_ROW_FILTER = "cache_key = ?1 AND (?2 IS NULL OR created_at >= datetime('now', ?2))"
+_SELECT_SQL = f"SELECT response_json FROM llm_cache WHERE {_FRESH_ROW_FILTER}"
+_TOUCH_SQL = f"""
+UPDATE llm_cache
+SET last_accessed = CURRENT_TIMESTAMP,
+    hit_count = hit_count + 1
+WHERE {_FRESH_ROW_FILTER}
+"""
+_TOUCH_RETURNING_SQL = f"{_TOUCH_SQL}RETURNING response_json"
+_UPSERT_SQL = """
+INSERT INTO llm_cache(cache_key, response_json)
+VALUES (?, ?)
+ON CONFLICT(cache_key)
+DO UPDATE SET
+    response_json = excluded.response_json,
+    created_at = CURRENT_TIMESTAMP,
+    last_accessed = CURRENT_TIMESTAMP
+"""
+# Position of the (max_entries + 1)-th most recently used row; it and everything
+# older is evicted. rowid breaks ties between same-second timestamps, and both
+# statements walk idx_llm_cache_last_accessed.
+_PRUNE_CUTOFF_SQL = """
+SELECT last_accessed, rowid
+FROM llm_cache
+ORDER BY last_accessed DESC, rowid DESC
+LIMIT 1 OFFSET ?
 """
+_PRUNE_SQL = "DELETE FROM llm_cache WHERE (last_accessed, rowid) <= (?, ?)"
+_PURGE_EXPIRED_SQL = "DELETE FROM llm_cache WHERE created_at < datetime('now', ?)"
+
+
+def _new_hasher():
+    if blake3 is not None:
+        return blake3.blake3()
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
+def _hexdigest(data: bytes) -> str:
+    hasher = _new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
 
 
 def build_cache_key(signature: dict) -> str:
-    payload = json.dumps(
-        signature,
-        sort_keys=True,
-        ensure_ascii=False,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return _hexdigest(json_codec.dumps_sorted(signature))
+
+
+def build_fields_cache_key(*fields) -> str:
+    # Each field is tagged and length-prefixed so adjacent values can't run
+    # together; str is hashed as UTF-8, everything else by repr().
+    hasher = _new_hasher()
+    for field in fields:
+        if isinstance(field, str):
+            tag, data = b"s", field.encode("utf-8")
+        else:
+            tag, data = b"r", repr(field).encode("utf-8")
+        hasher.update(tag + len(data).to_bytes(8, "little"))
+        hasher.update(data)
+    return hasher.hexdigest()
 
 
 class LLMResponseCache:
-    def __init__(self, db_path: str, *, max_entries: int = 0):
+    def __init__(self, db_path: str, *, max_entries: int = 0, ttl_seconds: int = 0):
         self.db_path = db_path
         self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        self._writes_since_prune = 0
         self._ensure_schema()
+        self._purge_expired()
+        self.flush()
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            for pragma in CACHE_CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        with self._conn_lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _ensure_schema(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(CACHE_SCHEMA_SQL)
+        with self._conn_lock:
+            self._connect().executescript(CACHE_SCHEMA_SQL)
+
+    def optimize(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA analysis_limit = 400")
+                self._conn.execute("PRAGMA optimize")
+
+    def close(self) -> None:
+        self.flush()
+        self.optimize()
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _expiry_modifier(self) -> str | None:
+        if not self.ttl_seconds or self.ttl_seconds <= 0:
+            return None
+        return f"-{int(self.ttl_seconds)} seconds"
+
+    def _purge_expired(self) -> None:
+        modifier = self._expiry_modifier()
+        if modifier is None:
+            return
+        with self._transaction() as conn:
+            conn.execute(_PURGE_EXPIRED_SQL, (modifier,))
 
     def get(self, cache_key: str) -> dict | None:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT response_json FROM llm_cache WHERE cache_key = ?",
-                (cache_key,),
-            ).fetchone()
-            if not row:
-                return None
-            conn.execute(
-                """
-                UPDATE llm_cache
-                SET last_accessed = CURRENT_TIMESTAMP,
-                    hit_count = hit_count + 1
-                WHERE cache_key = ?
-                """,
-                (cache_key,),
-            )
+        params = (cache_key, self._expiry_modifier())
+        with self._transaction() as conn:
+            if _SUPPORTS_RETURNING:
+                row = conn.execute(_TOUCH_RETURNING_SQL, params).fetchone()
+            else:
+                row = conn.execute(_SELECT_SQL, params).fetchone()
+                if row:
+                    conn.execute(_TOUCH_SQL, params)
+        if not row:
+            return None
         try:
-            parsed = json.loads(row[0])
+            parsed = json_codec.loads(row[0])
         except json.JSONDecodeError:
             return None
         return parsed if isinstance(parsed, dict) else None
 
     def set(self, cache_key: str, response: dict) -> None:
-        payload = json.dumps(response, ensure_ascii=False)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO llm_cache(cache_key, response_json)
-                VALUES (?, ?)
-                ON CONFLICT(cache_key)
-                DO UPDATE SET
-                    response_json = excluded.response_json,
-                    last_accessed = CURRENT_TIMESTAMP
-                """,
-                (cache_key, payload),
-            )
+        payload = json_codec.dumps(response)
+        with self._transaction() as conn:
+            conn.execute(_UPSERT_SQL, (cache_key, payload))
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= PRUNE_INTERVAL:
+                self._prune(conn)
+
+    def flush(self) -> None:
+        with self._transaction() as conn:
             self._prune(conn)
 
     def _prune(self, conn: sqlite3.Connection) -> None:
+        # Eviction runs every PRUNE_INTERVAL writes, so the table may briefly
+        # hold up to that many entries over max_entries.
+        self._writes_since_prune = 0
         if not self.max_entries or self.max_entries <= 0:
             return
-        row = conn.execute("SELECT COUNT(1) FROM llm_cache").fetchone()
-        if not row:
-            return
-        overage = row[0] - self.max_entries
-        if overage <= 0:
-            return
-        conn.execute(
-            """
-            DELETE FROM llm_cache
-            WHERE cache_key IN (
-                SELECT cache_key
-                FROM llm_cache
-                ORDER BY last_accessed ASC
-                LIMIT ?
-            )
-            """,
-            (overage,),
-        )
+        row = conn.execute(_PRUNE_CUTOFF_SQL, (self.max_entries,)).fetchone()
+        if row:
+            conn.execute(_PRUNE_SQL, row)
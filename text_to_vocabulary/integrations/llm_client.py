@@ -1,33 +1,84 @@
 import json
 import re
+from functools import lru_cache
 
 from text_to_vocabulary.config import DEFAULT_SYSTEM_PROMPT
 from text_to_vocabulary.domain.vocabulary import (
     LEXICAL_CATEGORIES,
     format_markdown_table,
 )
+from text_to_vocabulary.integrations import json_codec
 from text_to_vocabulary.integrations.http_client import HttpClient
-from text_to_vocabulary.integrations.llm_cache import build_cache_key
+from text_to_vocabulary.integrations.llm_cache import build_fields_cache_key
 from text_to_vocabulary.integrations.token_budget import calculate_max_tokens
 
-CACHE_VERSION = 1
+try:
+    import simdjson
+except Exception:  # pragma: no cover - optional dependency
+    simdjson = None
+
+CACHE_VERSION = 3
 _HTTP_CLIENT = HttpClient()
+_JSON_DECODER = json.JSONDecoder()
+
+
+_BRACE_TOKEN_RE = re.compile(r'[{}"]')
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def _matching_brace(content, start):
+    depth = 0
+    pos = start
+    while True:
+        match = _BRACE_TOKEN_RE.search(content, pos)
+        if match is None:
+            return -1
+        pos = match.end()
+        char = match.group()
+        if char == '"':
+            string = _JSON_STRING_RE.match(content, match.start())
+            if string is None:
+                return -1
+            pos = string.end()
+        elif char == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+
+
+def _scan_json_object(content):
+    # Walks balanced {...} spans once instead of retrying raw_decode from every "{".
+    start = content.find("{")
+    while start != -1:
+        end = _matching_brace(content, start)
+        if end == -1:
+            return None
+        try:
+            return json_codec.loads(content[start : end + 1])
+        except json.JSONDecodeError:
+            start = content.find("{", start + 1)
+    return None
 
 
 def extract_json(content):
     try:
-        return json.loads(content)
+        return json_codec.loads(content)
     except json.JSONDecodeError:
-        decoder = json.JSONDecoder()
+        parsed = _scan_json_object(content)
+        if parsed is not None:
+            return parsed
         index = content.find("{")
         while index != -1:
             try:
-                return decoder.raw_decode(content[index:])[0]
+                return _JSON_DECODER.raw_decode(content, index)[0]
             except json.JSONDecodeError:
                 index = content.find("{", index + 1)
         raise ValueError("No JSON object found in model response.")
 
 
+@lru_cache(maxsize=16)
 def normalize_endpoint(endpoint):
     cleaned = endpoint.rstrip("/")
     if cleaned.endswith("/v1"):
@@ -39,8 +90,49 @@ def normalize_endpoint(endpoint):
     return f"{cleaned}/v1/chat/completions"
 
 
+def _cache_text(text):
+    # Resubmissions that only differ in line wrapping or spacing share a cache entry.
+    return " ".join(text.split()) if isinstance(text, str) else text
+
+
+def _message_content(raw):
+    if simdjson is not None:
+        # On-demand lookup avoids building the whole envelope; any failure falls
+        # through to the full parse so errors surface the same way.
+        try:
+            return simdjson.Parser().parse(raw).at_pointer("/choices/0/message/content")
+        except Exception:
+            pass
+    data = json_codec.loads(raw)
+    return data["choices"][0]["message"]["content"]
+
+
+@lru_cache(maxsize=8)
+def _encode_system_message(content):
+    return json_codec.dumps({"role": "system", "content": content})
+
+
+def _encode_message(message):
+    if message.keys() == {"role", "content"} and message["role"] == "system":
+        return _encode_system_message(message["content"])
+    return json_codec.dumps(message)
+
+
+def _encode_chat_payload(payload):
+    # The system prompt is the bulk of every request and rarely changes, so its
+    # message is serialized once and spliced into each body.
+    parts = []
+    for key, value in payload.items():
+        if key == "messages":
+            encoded = b"[" + b",".join(_encode_message(message) for message in value) + b"]"
+        else:
+            encoded = json_codec.dumps(value)
+        parts.append(json_codec.dumps(key) + b":" + encoded)
+    return b"{" + b",".join(parts) + b"}"
+
+
 def _post_json(url, payload, *, timeout):
-    return _HTTP_CLIENT.post_json(url, payload, timeout=timeout)
+    return _HTTP_CLIENT.post_json(url, _encode_chat_payload(payload), timeout=timeout)
 
 
 def request_vocabulary_analysis(
@@ -72,18 +164,17 @@ def request_vocabulary_analysis(
 
     cache_key = None
     if cache is not None:
-        signature = {
-            "version": CACHE_VERSION,
-            "endpoint": endpoint,
-            "model": model,
-            "temperature": temperature,
-            "system_prompt": system_prompt,
-            "text": text,
-            "context_limit": context_limit,
-            "max_output_tokens": max_output_tokens,
-            "token_safety_margin": token_safety_margin,
-        }
-        cache_key = build_cache_key(signature)
+        cache_key = build_fields_cache_key(
+            CACHE_VERSION,
+            endpoint,
+            model,
+            temperature,
+            system_prompt,
+            _cache_text(text),
+            context_limit,
+            max_output_tokens,
+            token_safety_margin,
+        )
         try:
             cached = cache.get(cache_key)
         except Exception:
@@ -107,16 +198,18 @@ def request_vocabulary_analysis(
     }
     payload["max_tokens"] = calculate_max_tokens(payload["messages"], budget_settings)
     raw = _post_json(endpoint, payload, timeout=timeout)
-    data = json.loads(raw)
-    content = data["choices"][0]["message"]["content"]
+    content = _message_content(raw)
     parsed = extract_json(content)
     if not isinstance(parsed, dict):
         raise ValueError("Model response JSON must be an object.")
 
     result = {}
     for key in LEXICAL_CATEGORIES:
-        value = parsed.get(key, [])
-        result[key] = value if isinstance(value, list) else []
+        value = parsed.get(key)
+        if not value or not isinstance(value, list):
+            result[key] = []
+            continue
+        result[key] = value
     _apply_title_rules(result, text)
     result["table"] = format_markdown_table(result)
 
@@ -133,10 +226,17 @@ _TITLE_VARIANTS = {
     "mr.": {"mr", "mr."},
     "mrs.": {"mrs", "mrs."},
 }
-_TITLE_PATTERNS = {
-    canonical: re.compile(rf"\\b{canonical.rstrip('.')}\\.?\\b", re.IGNORECASE)
-    for canonical in _TITLE_VARIANTS
+_VARIANT_TO_CANONICAL = {
+    variant: canonical
+    for canonical, variants in _TITLE_VARIANTS.items()
+    for variant in variants
 }
+_TITLE_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(canonical.rstrip(".")) for canonical in _TITLE_VARIANTS)
+    + r")\.?\b",
+    re.IGNORECASE,
+)
 
 
 def _apply_title_rules(result: dict, text: str) -> None:
@@ -144,9 +244,8 @@ def _apply_title_rules(result: dict, text: str) -> None:
     found = set()
 
     source_text = text or ""
-    for canonical, pattern in _TITLE_PATTERNS.items():
-        if pattern.search(source_text):
-            found.add(canonical)
+    for match in _TITLE_RE.finditer(source_text):
+        found.add(f"{match.group(1).lower()}.")
 
     for key, values in result.items():
         if not isinstance(values, list):
@@ -156,14 +255,9 @@ def _apply_title_rules(result: dict, text: str) -> None:
             if not isinstance(value, str):
                 cleaned.append(value)
                 continue
-            normalized = value.strip().lower()
-            matched = None
-            for canonical, variants in _TITLE_VARIANTS.items():
-                if normalized in variants:
-                    found.add(canonical)
-                    matched = canonical
-                    break
-            if matched:
+            canonical = _VARIANT_TO_CANONICAL.get(value.strip().lower())
+            if canonical:
+                found.add(canonical)
                 continue
             cleaned.append(value)
         result[key] = cleaned
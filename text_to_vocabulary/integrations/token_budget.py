@@ -1,4 +1,7 @@
 import math
+import threading
+from contextlib import suppress
+from functools import lru_cache
 
 from text_to_vocabulary.config import (
     DEFAULT_CONTEXT_LIMIT,
@@ -6,9 +9,15 @@ from text_to_vocabulary.config import (
     DEFAULT_TOKEN_SAFETY_MARGIN,
 )
 
+try:
+    import tiktoken
+except Exception:  # pragma: no cover - optional dependency
+    tiktoken = None
+
 MIN_OUTPUT_TOKENS = 256
 _MESSAGE_OVERHEAD_TOKENS = 4
 _TOKENIZER_CACHE = {}
+_TOKENIZER_LOCK = threading.Lock()
 
 
 def _coerce_int(value, default, *, minimum=None):
@@ -40,6 +49,11 @@ def _stringify_content(content):
 def _flatten_message(message):
     if not isinstance(message, dict):
         return str(message)
+    if message.keys() == {"role", "content"}:
+        role = message["role"]
+        content = message["content"]
+        if role and content and isinstance(content, str):
+            return f"role:{role}\n{content}"
     role = message.get("role", "")
     content = _stringify_content(message.get("content", ""))
     extras = []
@@ -58,27 +72,38 @@ def _flatten_message(message):
 
 
 def _get_tokenizer(model):
-    try:
-        import tiktoken
-    except Exception:
+    if tiktoken is None:
         return None
     cache_key = model or "__default__"
     if cache_key in _TOKENIZER_CACHE:
         return _TOKENIZER_CACHE[cache_key]
-    try:
+    with _TOKENIZER_LOCK:
+        if cache_key in _TOKENIZER_CACHE:
+            return _TOKENIZER_CACHE[cache_key]
+        encoding = None
         if model:
-            encoding = tiktoken.encoding_for_model(model)
-        else:
-            encoding = tiktoken.get_encoding("cl100k_base")
-    except Exception:
-        try:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        except Exception:
-            return None
-    _TOKENIZER_CACHE[cache_key] = encoding
+            # KeyError for unknown models; loading the BPE file can also fail.
+            with suppress(Exception):
+                encoding = tiktoken.encoding_for_model(model)
+        if encoding is None:
+            # Failed lookups are cached as None so they are not retried per call.
+            with suppress(Exception):
+                encoding = tiktoken.get_encoding("cl100k_base")
+        _TOKENIZER_CACHE[cache_key] = encoding
     return encoding
 
 
+def prewarm_tokenizer(model=None):
+    thread = threading.Thread(target=_get_tokenizer, args=(model,), daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache(maxsize=32)
+def _encoded_len(text, model):
+    return len(_get_tokenizer(model).encode_ordinary(text))
+
+
 def estimate_input_tokens(messages, *, model=None):
     if messages is None:
         return 0
@@ -88,10 +113,17 @@ def estimate_input_tokens(messages, *, model=None):
         return 0
     tokenizer = _get_tokenizer(model)
     if tokenizer is not None:
-        text = "\n\n".join(_flatten_message(message) for message in messages)
-        if not text:
+        texts = [_flatten_message(message) for message in messages]
+        if not any(texts):
             return 0
-        return len(tokenizer.encode(text)) + (len(messages) * _MESSAGE_OVERHEAD_TOKENS)
+        # Messages are encoded separately so a repeated system prompt hits the
+        # cache; len(texts) - 1 stands in for the blank-line separators.
+        token_count = sum(_encoded_len(text, model) for text in texts if text)
+        return (
+            token_count
+            + (len(texts) - 1)
+            + (len(messages) * _MESSAGE_OVERHEAD_TOKENS)
+        )
 
     char_count = 0
     word_count = 0
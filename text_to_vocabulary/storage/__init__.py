@@ -1,23 +1,24 @@
-from text_to_vocabulary.storage.ods_exporter import (
-    export_sqlite_to_ods,
-    export_storage_to_ods,
-)
-from text_to_vocabulary.storage.ods_importer import (
-    import_ods_to_sqlite,
-    import_ods_to_storage,
-)
-from text_to_vocabulary.storage.ods_vocabulary_store import (
-    append_missing_words,
-    append_missing_words_txt,
-    read_words_from_ods,
-    read_words_from_txt,
-    write_rows_to_ods,
-    write_vocabulary_exports,
-    write_words_to_ods,
-)
-from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
-from text_to_vocabulary.storage.vocabulary_cache import VocabularyCache
-from text_to_vocabulary.storage.vocabulary_storage import VocabularyStorage
+import importlib
+
+# Resolved on first access so opening the SQLite storage doesn't also load the
+# ODS readers and writers (expat, ElementTree) until an import or export runs.
+_EXPORTS = {
+    "export_sqlite_to_ods": "text_to_vocabulary.storage.ods_exporter",
+    "export_storage_to_ods": "text_to_vocabulary.storage.ods_exporter",
+    "import_ods_to_sqlite": "text_to_vocabulary.storage.ods_importer",
+    "import_ods_to_storage": "text_to_vocabulary.storage.ods_importer",
+    "append_missing_words": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "append_missing_words_txt": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "iter_words_from_ods": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "read_words_from_ods": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "read_words_from_txt": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "write_rows_to_ods": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "write_vocabulary_exports": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "write_words_to_ods": "text_to_vocabulary.storage.ods_vocabulary_store",
+    "SQLiteVocabularyStorage": "text_to_vocabulary.storage.sqlite_vocabulary_storage",
+    "VocabularyCache": "text_to_vocabulary.storage.vocabulary_cache",
+    "VocabularyStorage": "text_to_vocabulary.storage.vocabulary_storage",
+}
 
 __all__ = [
     "SQLiteVocabularyStorage",
@@ -29,9 +30,19 @@ __all__ = [
     "export_storage_to_ods",
     "import_ods_to_sqlite",
     "import_ods_to_storage",
+    "iter_words_from_ods",
     "read_words_from_ods",
     "read_words_from_txt",
     "write_rows_to_ods",
     "write_vocabulary_exports",
     "write_words_to_ods",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,13 +1,22 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
 from text_to_vocabulary.storage.ods_vocabulary_store import (
+    render_row_xml,
+    write_columns_to_ods,
     write_rows_to_ods,
     write_words_to_ods,
 )
 from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
 from text_to_vocabulary.storage.vocabulary_storage import VocabularyStorage
 
+_HEADER_ROW_XML = render_row_xml(LEXICAL_CATEGORIES)
+_CATEGORY_COLUMNS = {category: index for index, category in enumerate(LEXICAL_CATEGORIES)}
+MAX_EXPORT_WORKERS = 8
+EXPORT_PROGRESS_ROWS = 1000
+
 
 def export_sqlite_to_ods(
     db_path: str,
@@ -43,25 +52,62 @@ def export_storage_to_ods(
     return _export_consolidated(storage, output_dir, consolidated_name)
 
 
-def export_storage_to_single_file(storage: VocabularyStorage, file_path: str) -> dict:
+def export_storage_to_single_file(
+    storage: VocabularyStorage, file_path: str, *, progress=None
+) -> dict:
+    rows = _iter_grid_rows(storage)
+    if progress is not None:
+        rows = _report_progress(rows, progress)
+    write_rows_to_ods(file_path, chain([_HEADER_ROW_XML], rows))
+    return {"mode": "single", "files": {"single": file_path}}
+
+
+def _report_progress(rows, progress):
+    # Rows stream from the database cursor into the archive, so the count of
+    # rows written so far is the only progress there is to report.
+    count = 0
+    for count, row in enumerate(rows, 1):
+        yield row
+        if count % EXPORT_PROGRESS_ROWS == 0:
+            progress(count)
+    if count == 0 or count % EXPORT_PROGRESS_ROWS:
+        progress(count)
+
+
+def _iter_grid_rows(storage: VocabularyStorage):
+    grid = getattr(storage, "iter_word_grid", None)
+    if not callable(grid):
+        yield from _iter_grid_rows_from_map(storage)
+        return
+
+    width = len(LEXICAL_CATEGORIES)
+    current_index = None
+    row = None
+    for row_index, category, word in grid():
+        column = _CATEGORY_COLUMNS.get(category)
+        if column is None:
+            continue
+        if row_index != current_index:
+            if row is not None:
+                yield row
+            row = [None] * width
+            current_index = row_index
+        row[column] = word
+    if row is not None:
+        yield row
+
+
+def _iter_grid_rows_from_map(storage: VocabularyStorage):
     words_by_category = _get_words_map(storage)
-    max_len = max(
-        (len(words_by_category.get(category, [])) for category in LEXICAL_CATEGORIES),
-        default=0,
-    )
     category_words = [
         words_by_category.get(category, []) for category in LEXICAL_CATEGORIES
     ]
-
-    def iter_rows():
-        for index in range(max_len):
-            yield [
-                words[index] if index < len(words) else None
-                for words in category_words
-            ]
-
-    write_rows_to_ods(file_path, iter_rows(), headers=LEXICAL_CATEGORIES)
-    return {"mode": "single", "files": {"single": file_path}}
+    max_len = max((len(words) for words in category_words), default=0)
+    for index in range(max_len):
+        yield [
+            words[index] if index < len(words) else None
+            for words in category_words
+        ]
 
 
 def _get_words_map(storage: VocabularyStorage) -> dict[str, list[str]]:
@@ -72,25 +118,34 @@ def _get_words_map(storage: VocabularyStorage) -> dict[str, list[str]]:
 
 
 def _export_per_category(storage: VocabularyStorage, output_dir: str) -> dict:
-    saved_files = {}
     words_by_category = _get_words_map(storage)
-    for category in LEXICAL_CATEGORIES:
-        words = words_by_category.get(category, [])
-        path = os.path.join(output_dir, f"{category}.ods")
-        write_words_to_ods(path, words)
-        saved_files[category] = path
+    saved_files = {
+        category: os.path.join(output_dir, f"{category}.ods")
+        for category in LEXICAL_CATEGORIES
+    }
+
+    def write_category(category):
+        write_words_to_ods(saved_files[category], words_by_category.get(category, []))
+
+    workers = min(MAX_EXPORT_WORKERS, len(LEXICAL_CATEGORIES))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(write_category, LEXICAL_CATEGORIES))
     return {"mode": "per_category", "files": saved_files}
 
 
 def _export_consolidated(
     storage: VocabularyStorage, output_dir: str, consolidated_name: str
 ) -> dict:
-    rows = []
+    category_column = []
+    word_column = []
     words_by_category = _get_words_map(storage)
     for category in LEXICAL_CATEGORIES:
         words = words_by_category.get(category, [])
-        rows.extend([(category, word) for word in words])
+        category_column.extend([category] * len(words))
+        word_column.extend(words)
 
     path = os.path.join(output_dir, consolidated_name)
-    write_rows_to_ods(path, rows, headers=["category", "word"])
+    write_columns_to_ods(
+        path, (category_column, word_column), headers=["category", "word"]
+    )
     return {"mode": "consolidated", "files": {"consolidated": path}}
@@ -1,14 +1,17 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
 from text_to_vocabulary.storage.ods_vocabulary_store import (
-    read_words_from_ods,
+    iter_words_from_ods,
     read_words_from_txt,
 )
 from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
 from text_to_vocabulary.storage.vocabulary_storage import VocabularyStorage
 
+MAX_IMPORT_WORKERS = 8
+
 
 def import_ods_to_sqlite(input_dir: str, db_path: str) -> dict:
     storage = SQLiteVocabularyStorage(db_path)
@@ -27,25 +30,27 @@ def import_ods_to_storage(input_dir: str, storage: VocabularyStorage) -> dict:
     pending_imports = {}
     category_meta = {}
 
-    for category in LEXICAL_CATEGORIES:
-        ods_path = os.path.join(input_dir, f"{category}.ods")
-        txt_path = os.path.join(input_dir, f"{category}.txt")
-
-        if os.path.exists(ods_path):
-            words, error = _safe_read(ods_path, read_words_from_ods)
-            source = "ods"
-        elif os.path.exists(txt_path):
-            words, error = _safe_read(txt_path, read_words_from_txt)
-            source = "txt"
-        else:
+    file_names = _list_file_names(input_dir)
+
+    def read_category(category):
+        return _read_category(input_dir, category, file_names)
+
+    # Reads overlap on zip inflation and file I/O; the merge below stays a
+    # single call on this thread.
+    workers = min(MAX_IMPORT_WORKERS, len(LEXICAL_CATEGORIES))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(read_category, LEXICAL_CATEGORIES))
+
+    for category, result in zip(LEXICAL_CATEGORIES, results):
+        if result is None:
             continue
+        source, path, input_count, cleaned_words, malformed_examples, error = result
 
         if error:
-            report["skipped_files"].append({"path": ods_path if source == "ods" else txt_path})
-            report["errors"].append({"path": ods_path if source == "ods" else txt_path, "error": error})
+            report["skipped_files"].append({"path": path})
+            report["errors"].append({"path": path, "error": error})
             continue
 
-        cleaned_words, malformed_examples = _filter_import_words(words)
         report["malformed"]["count"] += len(malformed_examples)
         if malformed_examples:
             report["malformed"]["examples"].extend(
@@ -55,39 +60,64 @@ def import_ods_to_storage(input_dir: str, storage: VocabularyStorage) -> dict:
         pending_imports[category] = cleaned_words
         category_meta[category] = {
             "source": source,
-            "input_count": len(words),
+            "input_count": input_count,
             "unique_imported": len(cleaned_words),
         }
 
     if pending_imports:
-        bulk_merge = getattr(storage, "merge_categories", None)
-        if callable(bulk_merge):
-            added_counts = bulk_merge(pending_imports, source="ods_import")
-            for category, meta in category_meta.items():
-                added = added_counts.get(category, 0)
-                meta["added"] = added
-                report["total_added"] += added
-                report["categories"][category] = meta
-        else:
-            for category, cleaned_words in pending_imports.items():
-                added = storage.merge_words(category, cleaned_words, source="ods_import")
-                report["total_added"] += added
-                meta = category_meta[category]
-                meta["added"] = added
-                report["categories"][category] = meta
+        added_counts = storage.merge_categories(pending_imports, source="ods_import")
+        for category, meta in category_meta.items():
+            added = added_counts.get(category, 0)
+            meta["added"] = added
+            report["total_added"] += added
+            report["categories"][category] = meta
 
     return report
 
 
-def _safe_read(path: str, reader) -> tuple[list[str], str | None]:
+def _list_file_names(input_dir: str) -> set[str]:
+    # One directory listing instead of two exists() stats per category.
+    try:
+        with os.scandir(input_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _read_category(input_dir: str, category: str, file_names: set[str]):
+    ods_name = f"{category}.ods"
+    if ods_name in file_names:
+        ods_path = os.path.join(input_dir, ods_name)
+        return ("ods", ods_path, *_safe_read(ods_path, iter_words_from_ods))
+    txt_name = f"{category}.txt"
+    if txt_name in file_names:
+        txt_path = os.path.join(input_dir, txt_name)
+        return ("txt", txt_path, *_safe_read(txt_path, read_words_from_txt))
+    return None
+
+
+def _safe_read(path: str, reader) -> tuple[int, list[str], list[str], str | None]:
+    # Words are filtered as the reader yields them, so only the deduped list is
+    # kept in memory rather than every row of the sheet.
+    input_count = 0
+
+    def counted(words):
+        nonlocal input_count
+        for word in words:
+            input_count += 1
+            yield word
+
     try:
-        return reader(path), None
+        cleaned, malformed = _filter_import_words(counted(reader(path)))
     except Exception as exc:
-        return [], str(exc)
+        return 0, [], [], str(exc)
+    return input_count, cleaned, malformed, None
 
 
 def _filter_import_words(words: Iterable[str]) -> tuple[list[str], list[str]]:
-    cleaned = []
+    # Keyed like the storage lemma so repeats collapse here instead of in the
+    # merge; setdefault keeps the first surface form, as the merge would.
+    unique = {}
     malformed = []
 
     for word in words:
@@ -97,9 +127,9 @@ def _filter_import_words(words: Iterable[str]) -> tuple[list[str], list[str]]:
         if not word:
             malformed.append(word)
             continue
-        cleaned.append(word)
+        unique.setdefault(word.strip().casefold(), word)
 
-    return cleaned, malformed
+    return list(unique.values()), malformed
 
 
 def _cap_examples(examples: list[str], remaining: int) -> list[str]:
@@ -1,198 +1,250 @@
+import io
 import os
 import zipfile
 from itertools import chain
 from xml.etree import ElementTree as ET
+from xml.parsers import expat
+from xml.sax.saxutils import escape
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES, dedupe_preserve_order
 from text_to_vocabulary.storage.vocabulary_cache import VocabularyCache
 
-
 ODS_MIMETYPE = "application/vnd.oasis.opendocument.spreadsheet"
+CONTENT_XML_BUFFER_SIZE = 1 << 20
+CONTENT_XML_READ_BUFFER_SIZE = 256 * 1024
+# Deflate level for ODS archives; 0 stores entries uncompressed.
+ODS_COMPRESS_LEVEL = 1
 
 NS_OFFICE = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
 NS_TABLE = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
 NS_TEXT = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
 NS_MANIFEST = "urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"
 
-ET.register_namespace("office", NS_OFFICE)
-ET.register_namespace("table", NS_TABLE)
-ET.register_namespace("text", NS_TEXT)
-ET.register_namespace("manifest", NS_MANIFEST)
-
 
 def read_words_from_txt(path):
     if not os.path.exists(path):
         return []
     with open(path, "r", encoding="utf-8") as handle:
-        return [line.strip() for line in handle if line.strip()]
+        # Text mode already maps \r\n and \r to \n, so this splits exactly like
+        # line iteration without a Python-level step per line.
+        lines = handle.read().split("\n")
+    return [word for word in map(str.strip, lines) if word]
 
 
 def read_words_from_ods(path):
+    return list(iter_words_from_ods(path))
+
+
+def iter_words_from_ods(path):
     if not os.path.exists(path):
-        return []
+        return
 
     with zipfile.ZipFile(path, "r") as archive:
         try:
-            with archive.open("content.xml") as content_xml:
-                return _read_words_from_ods_stream(content_xml)
+            content_xml = io.BufferedReader(
+                archive.open("content.xml"),
+                buffer_size=CONTENT_XML_READ_BUFFER_SIZE,
+            )
         except KeyError:
-            return []
+            return
+        with content_xml:
+            yield from _iter_words_from_ods_sax(content_xml)
 
 
-def _read_words_from_ods_stream(content_xml):
-    words = []
-    row_tag = f"{{{NS_TABLE}}}table-row"
-    cell_tag = f"{{{NS_TABLE}}}table-cell"
-    text_tag = f"{{{NS_TEXT}}}p"
+_EXPAT_ROW = f"{NS_TABLE}|table-row"
+_EXPAT_CELL = f"{NS_TABLE}|table-cell"
+_EXPAT_PARAGRAPH = f"{NS_TEXT}|p"
 
-    for event, elem in ET.iterparse(content_xml, events=("end",)):
-        if elem.tag != row_tag:
-            continue
-        cell = elem.find(cell_tag)
-        if cell is None:
-            elem.clear()
-            continue
-        text_nodes = cell.findall(text_tag)
-        if text_nodes:
-            value = "\n".join("".join(node.itertext()) for node in text_nodes)
-        else:
-            value = "".join(cell.itertext())
-        value = value.strip()
-        if value:
-            words.append(value)
-        elem.clear()
 
-    return words
+def _iter_words_from_ods_sax(content_xml):
+    # Each row contributes its first cell: its text:p paragraphs joined by
+    # newlines, or the cell's raw text when it has none. Driven by expat
+    # callbacks so no element objects are built for the rows at all.
+    # Words found in each fed chunk are yielded before the next read.
+    words = []
+    row_depth = None
+    cell_depth = None
+    cells_seen = 0
+    depth = 0
+    paragraphs = []
+    paragraph_parts = None
+    cell_parts = []
+
+    def start(name, _attrs):
+        nonlocal depth, row_depth, cell_depth, cells_seen, paragraph_parts
+        depth += 1
+        if row_depth is None:
+            if name == _EXPAT_ROW:
+                row_depth = depth
+                cells_seen = 0
+            return
+        if depth == row_depth + 1 and name == _EXPAT_CELL:
+            cells_seen += 1
+            if cells_seen == 1:
+                cell_depth = depth
+                paragraphs.clear()
+                cell_parts.clear()
+        elif cell_depth is not None and depth == cell_depth + 1 and name == _EXPAT_PARAGRAPH:
+            paragraph_parts = []
+
+    def end(_name):
+        nonlocal depth, row_depth, cell_depth, paragraph_parts
+        if paragraph_parts is not None and depth == cell_depth + 1:
+            paragraphs.append("".join(paragraph_parts))
+            paragraph_parts = None
+        elif cell_depth is not None and depth == cell_depth:
+            cell_depth = None
+            value = "\n".join(paragraphs) if paragraphs else "".join(cell_parts)
+            value = value.strip()
+            if value:
+                words.append(value)
+        elif depth == row_depth:
+            row_depth = None
+        depth -= 1
+
+    def characters(data):
+        if cell_depth is None:
+            return
+        cell_parts.append(data)
+        if paragraph_parts is not None:
+            paragraph_parts.append(data)
+
+    parser = expat.ParserCreate(namespace_separator="|")
+    parser.buffer_text = True
+    parser.buffer_size = CONTENT_XML_READ_BUFFER_SIZE
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    while True:
+        chunk = content_xml.read(CONTENT_XML_READ_BUFFER_SIZE)
+        parser.Parse(chunk, not chunk)
+        yield from words
+        words.clear()
+        if not chunk:
+            return
+
+
+_CONTENT_XML_PROLOG = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    f'<office:document-content xmlns:office="{NS_OFFICE}" '
+    f'xmlns:table="{NS_TABLE}" xmlns:text="{NS_TEXT}" office:version="1.2">'
+    "<office:body><office:spreadsheet>"
+)
+_CONTENT_XML_EPILOG = (
+    b"</table:table></office:spreadsheet></office:body></office:document-content>"
+)
+_CELL_START = '<table:table-cell office:value-type="string"><text:p>'
+_CELL_END = "</text:p></table:table-cell>"
+
+
+def render_row_xml(values):
+    cells = "".join(
+        f"{_CELL_START}{escape('' if value is None else str(value))}{_CELL_END}"
+        for value in values
+    )
+    return f"<table:table-row>{cells}</table:table-row>".encode("utf-8")
 
 
-def build_content_xml(words):
-    doc = ET.Element(
-        f"{{{NS_OFFICE}}}document-content",
-        {f"{{{NS_OFFICE}}}version": "1.2"},
-    )
-    body = ET.SubElement(doc, f"{{{NS_OFFICE}}}body")
-    spreadsheet = ET.SubElement(body, f"{{{NS_OFFICE}}}spreadsheet")
-    table = ET.SubElement(
-        spreadsheet,
-        f"{{{NS_TABLE}}}table",
-        {f"{{{NS_TABLE}}}name": "Words"},
-    )
+_WORD_ROW_START = f"<table:table-row>{_CELL_START}"
+_WORD_ROW_END = f"{_CELL_END}</table:table-row>"
 
+
+def _iter_word_rows(words):
+    # Single-column rows skip render_row_xml's per-row tuple and generator join.
     for word in words:
-        row = ET.SubElement(table, f"{{{NS_TABLE}}}table-row")
-        cell = ET.SubElement(
-            row,
-            f"{{{NS_TABLE}}}table-cell",
-            {f"{{{NS_OFFICE}}}value-type": "string"},
-        )
-        entry = ET.SubElement(cell, f"{{{NS_TEXT}}}p")
-        entry.text = word
+        value = escape("" if word is None else str(word))
+        yield f"{_WORD_ROW_START}{value}{_WORD_ROW_END}".encode("utf-8")
 
-    return ET.tostring(doc, encoding="utf-8", xml_declaration=True)
 
+def _iter_content_xml(rows, table_name):
+    yield (
+        f'{_CONTENT_XML_PROLOG}<table:table table:name="{escape(table_name)}">'
+    ).encode("utf-8")
+    for row_values in rows:
+        if isinstance(row_values, bytes):
+            yield row_values
+        else:
+            yield render_row_xml(row_values)
+    yield _CONTENT_XML_EPILOG
 
-def build_content_xml_rows(rows):
-    doc = ET.Element(
-        f"{{{NS_OFFICE}}}document-content",
-        {f"{{{NS_OFFICE}}}version": "1.2"},
-    )
-    body = ET.SubElement(doc, f"{{{NS_OFFICE}}}body")
-    spreadsheet = ET.SubElement(body, f"{{{NS_OFFICE}}}spreadsheet")
-    table = ET.SubElement(
-        spreadsheet,
-        f"{{{NS_TABLE}}}table",
-        {f"{{{NS_TABLE}}}name": "Vocabulary"},
-    )
 
-    for row_values in rows:
-        row = ET.SubElement(table, f"{{{NS_TABLE}}}table-row")
-        for value in row_values:
-            cell = ET.SubElement(
-                row,
-                f"{{{NS_TABLE}}}table-cell",
-                {f"{{{NS_OFFICE}}}value-type": "string"},
-            )
-            entry = ET.SubElement(cell, f"{{{NS_TEXT}}}p")
-            entry.text = "" if value is None else str(value)
+def build_content_xml(words):
+    return b"".join(_iter_content_xml(_iter_word_rows(words), "Words"))
 
-    return ET.tostring(doc, encoding="utf-8", xml_declaration=True)
+
+def build_content_xml_rows(rows):
+    return b"".join(_iter_content_xml(rows, "Vocabulary"))
 
 
 def build_styles_xml():
+    # Prefixes are declared on the root rather than via ET.register_namespace,
+    # which would change serialization for every ElementTree user in-process.
     doc = ET.Element(
-        f"{{{NS_OFFICE}}}document-styles",
-        {f"{{{NS_OFFICE}}}version": "1.2"},
+        "office:document-styles",
+        {"xmlns:office": NS_OFFICE, "office:version": "1.2"},
     )
-    ET.SubElement(doc, f"{{{NS_OFFICE}}}styles")
+    ET.SubElement(doc, "office:styles")
     return ET.tostring(doc, encoding="utf-8", xml_declaration=True)
 
 
 def build_manifest_xml():
     manifest = ET.Element(
-        f"{{{NS_MANIFEST}}}manifest",
-        {f"{{{NS_MANIFEST}}}version": "1.2"},
-    )
-    ET.SubElement(
-        manifest,
-        f"{{{NS_MANIFEST}}}file-entry",
-        {
-            f"{{{NS_MANIFEST}}}media-type": ODS_MIMETYPE,
-            f"{{{NS_MANIFEST}}}full-path": "/",
-        },
-    )
-    ET.SubElement(
-        manifest,
-        f"{{{NS_MANIFEST}}}file-entry",
-        {
-            f"{{{NS_MANIFEST}}}media-type": "text/xml",
-            f"{{{NS_MANIFEST}}}full-path": "content.xml",
-        },
-    )
-    ET.SubElement(
-        manifest,
-        f"{{{NS_MANIFEST}}}file-entry",
-        {
-            f"{{{NS_MANIFEST}}}media-type": "text/xml",
-            f"{{{NS_MANIFEST}}}full-path": "styles.xml",
-        },
+        "manifest:manifest",
+        {"xmlns:manifest": NS_MANIFEST, "manifest:version": "1.2"},
     )
+    for media_type, full_path in (
+        (ODS_MIMETYPE, "/"),
+        ("text/xml", "content.xml"),
+        ("text/xml", "styles.xml"),
+    ):
+        ET.SubElement(
+            manifest,
+            "manifest:file-entry",
+            {"manifest:media-type": media_type, "manifest:full-path": full_path},
+        )
     return ET.tostring(manifest, encoding="utf-8", xml_declaration=True)
 
 
-def write_words_to_ods(path, words):
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+# Both documents are fixed, so every archive reuses the same serialized bytes.
+_STYLES_XML = build_styles_xml()
+_MANIFEST_XML = build_manifest_xml()
+
 
-    content_xml = build_content_xml(words)
-    styles_xml = build_styles_xml()
-    manifest_xml = build_manifest_xml()
+def _write_ods(path, rows, table_name, compresslevel):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    if compresslevel:
+        options = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": compresslevel}
+    else:
+        options = {"compression": zipfile.ZIP_STORED}
+    with zipfile.ZipFile(path, "w", **options) as archive:
         mimetype_info = zipfile.ZipInfo("mimetype")
         mimetype_info.compress_type = zipfile.ZIP_STORED
         archive.writestr(mimetype_info, ODS_MIMETYPE)
-        archive.writestr("content.xml", content_xml)
-        archive.writestr("styles.xml", styles_xml)
-        archive.writestr("META-INF/manifest.xml", manifest_xml)
+        with io.BufferedWriter(
+            archive.open("content.xml", "w", force_zip64=True),
+            buffer_size=CONTENT_XML_BUFFER_SIZE,
+        ) as content_xml:
+            for chunk in _iter_content_xml(rows, table_name):
+                content_xml.write(chunk)
+        archive.writestr("styles.xml", _STYLES_XML)
+        archive.writestr("META-INF/manifest.xml", _MANIFEST_XML)
 
 
-def write_rows_to_ods(path, rows, headers=None):
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+def write_words_to_ods(path, words, *, compresslevel=ODS_COMPRESS_LEVEL):
+    _write_ods(path, _iter_word_rows(words), "Words", compresslevel)
 
+
+def write_rows_to_ods(path, rows, headers=None, *, compresslevel=ODS_COMPRESS_LEVEL):
     row_iter = rows
     if headers:
         row_iter = chain([headers], rows)
+    _write_ods(path, row_iter, "Vocabulary", compresslevel)
 
-    content_xml = build_content_xml_rows(row_iter)
-    styles_xml = build_styles_xml()
-    manifest_xml = build_manifest_xml()
 
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        mimetype_info = zipfile.ZipInfo("mimetype")
-        mimetype_info.compress_type = zipfile.ZIP_STORED
-        archive.writestr(mimetype_info, ODS_MIMETYPE)
-        archive.writestr("content.xml", content_xml)
-        archive.writestr("styles.xml", styles_xml)
-        archive.writestr("META-INF/manifest.xml", manifest_xml)
+def write_columns_to_ods(path, columns, headers=None, *, compresslevel=ODS_COMPRESS_LEVEL):
+    # zip() hands render_row_xml one reused tuple per row instead of a stored list.
+    write_rows_to_ods(path, zip(*columns), headers=headers, compresslevel=compresslevel)
 
 
 def _load_words(path, cache, loader):
@@ -213,24 +265,65 @@ def _load_existing_words(path, cache):
     return None, [], ods_exists
 
 
+def _word_set(path, existing_words, cache):
+    word_set = cache.get_word_set(path) if cache is not None else None
+    if word_set is None:
+        word_set = frozenset(map(str.strip, existing_words)) - {""}
+    return word_set
+
+
+def _missing_words(existing_set, words):
+    strip = str.strip
+    added = set()
+    new_words = []
+    for word in words:
+        if word is None:
+            continue
+        cleaned = strip(word)
+        if cleaned and cleaned not in existing_set and cleaned not in added:
+            added.add(cleaned)
+            new_words.append(cleaned)
+    return new_words
+
+
 def append_missing_words(path, words, cache=None):
     extension = os.path.splitext(path)[1].lower()
     if extension != ".ods":
         return append_missing_words_txt(path, words, cache=cache)
 
-    source, existing_words, ods_exists = _load_existing_words(path, cache)
+    return _append_missing_ods_words(
+        path, words, _load_existing_words(path, cache), cache
+    )
+
 
-    existing_set = {word.strip() for word in existing_words if word.strip()}
-    cleaned = [word.strip() for word in words if word is not None]
-    new_words = [word for word in cleaned if word and word not in existing_set]
+def _append_missing_ods_words(path, words, existing, cache):
+    source, existing_words, ods_exists = existing
+
+    # A legacy .txt source is cached under its own path, not this one.
+    existing_set = _word_set(path, existing_words, cache if source == "ods" else None)
+    new_words = _missing_words(existing_set, words)
 
     if not new_words and not (existing_words and source == "txt" and not ods_exists):
         return 0
 
-    updated_words = existing_words + new_words
-    write_words_to_ods(path, updated_words)
-    if cache is not None:
-        cache.update_words(path, updated_words)
+    updated_words = [*existing_words, *new_words]
+    if cache is None:
+        write_words_to_ods(path, updated_words)
+        return len(new_words)
+
+    # Keep the rendered rows alongside the cached words so the next append only
+    # renders the new words instead of re-escaping the whole file.
+    rows_xml = cache.get_rows_xml(path)
+    if rows_xml is None:
+        rows_xml = b"".join(_iter_word_rows(existing_words))
+    rows_xml += b"".join(_iter_word_rows(new_words))
+    _write_ods(path, (rows_xml,), "Words", ODS_COMPRESS_LEVEL)
+    cache.update_words(
+        path,
+        updated_words,
+        rows_xml=rows_xml,
+        word_set=existing_set.union(new_words),
+    )
 
     return len(new_words)
 
@@ -240,9 +333,8 @@ def append_missing_words_txt(path, words, cache=None):
     if os.path.exists(path):
         existing_words = _load_words(path, cache, read_words_from_txt)
 
-    existing_set = {word.strip() for word in existing_words if word.strip()}
-    cleaned = [word.strip() for word in words if word is not None]
-    new_words = [word for word in cleaned if word and word not in existing_set]
+    existing_set = _word_set(path, existing_words, cache)
+    new_words = _missing_words(existing_set, words)
     if not new_words:
         return 0
 
@@ -251,7 +343,9 @@ def append_missing_words_txt(path, words, cache=None):
             handle.write(f"{word}\n")
 
     if cache is not None:
-        cache.update_words(path, existing_words + new_words)
+        cache.update_words(
+            path, [*existing_words, *new_words], word_set=existing_set.union(new_words)
+        )
 
     return len(new_words)
 
@@ -268,13 +362,10 @@ def write_vocabulary_exports(output_dir, data, cache=None):
         path = os.path.join(output_dir, filename)
         saved_files[key] = path
         words = dedupe_preserve_order(data.get(key, []))
-        if not words:
-            txt_path = os.path.splitext(path)[0] + ".txt"
-            if not os.path.exists(path) and os.path.exists(txt_path):
-                added_counts[key] = append_missing_words(path, words, cache=cache)
-            else:
-                added_counts[key] = 0
+        if not words and os.path.exists(path):
+            added_counts[key] = 0
             continue
-        added_counts[key] = append_missing_words(path, words, cache=cache)
+        existing = _load_existing_words(path, cache)
+        added_counts[key] = _append_missing_ods_words(path, words, existing, cache)
 
     return saved_files, added_counts
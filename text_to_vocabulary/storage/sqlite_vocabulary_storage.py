@@ -1,7 +1,11 @@
 import os
 import re
 import sqlite3
-from typing import Iterable
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Iterator
 
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES
 from text_to_vocabulary.storage.vocabulary_storage import VocabularyStorage
@@ -39,6 +43,11 @@ CREATE INDEX IF NOT EXISTS idx_words_lemma
 
 CREATE INDEX IF NOT EXISTS idx_category_words_surface
     ON category_words(surface_form);
+
+DROP INDEX IF EXISTS idx_category_words_category_surface;
+
+CREATE INDEX IF NOT EXISTS idx_category_words_category_surface_word
+    ON category_words(category_id, surface_form COLLATE NOCASE, word_id);
 """
 
 FTS_SCHEMA_SQL = """
@@ -51,7 +60,7 @@ CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
 );
 """
 
-FTS_TRIGGERS_SQL = """
+FTS_INSERT_TRIGGER_SQL = """
 CREATE TRIGGER IF NOT EXISTS category_words_ai
 AFTER INSERT ON category_words
 BEGIN
@@ -62,7 +71,9 @@ BEGIN
         new.surface_form
     );
 END;
+"""
 
+FTS_DELETE_TRIGGER_SQL = """
 CREATE TRIGGER IF NOT EXISTS category_words_ad
 AFTER DELETE ON category_words
 BEGIN
@@ -74,7 +85,9 @@ BEGIN
         old.surface_form
     );
 END;
+"""
 
+FTS_UPDATE_TRIGGER_SQL = """
 CREATE TRIGGER IF NOT EXISTS category_words_au
 AFTER UPDATE ON category_words
 BEGIN
@@ -92,7 +105,9 @@ BEGIN
         new.surface_form
     );
 END;
+"""
 
+FTS_LEMMA_UPDATE_TRIGGER_SQL = """
 CREATE TRIGGER IF NOT EXISTS words_au
 AFTER UPDATE OF lemma ON words
 BEGIN
@@ -111,6 +126,185 @@ BEGIN
 END;
 """
 
+FTS_TRIGGERS_SQL = "\n".join(
+    (
+        FTS_INSERT_TRIGGER_SQL,
+        FTS_DELETE_TRIGGER_SQL,
+        FTS_UPDATE_TRIGGER_SQL,
+        FTS_LEMMA_UPDATE_TRIGGER_SQL,
+    )
+)
+
+# Substring index for searches the token index can't answer, e.g. "x-ray".
+# Kept in its own table and triggers so builds without the trigram tokenizer
+# (SQLite < 3.34) still get words_fts.
+TRIGRAM_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS words_trigram USING fts5(
+    lemma,
+    surface_form,
+    content='',
+    tokenize='trigram'
+);
+"""
+
+TRIGRAM_INSERT_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS category_words_trigram_ai
+AFTER INSERT ON category_words
+BEGIN
+    INSERT INTO words_trigram(rowid, lemma, surface_form)
+    VALUES (
+        new.id,
+        (SELECT lemma FROM words WHERE id = new.word_id),
+        new.surface_form
+    );
+END;
+"""
+
+TRIGRAM_DELETE_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS category_words_trigram_ad
+AFTER DELETE ON category_words
+BEGIN
+    INSERT INTO words_trigram(words_trigram, rowid, lemma, surface_form)
+    VALUES (
+        'delete',
+        old.id,
+        (SELECT lemma FROM words WHERE id = old.word_id),
+        old.surface_form
+    );
+END;
+"""
+
+TRIGRAM_UPDATE_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS category_words_trigram_au
+AFTER UPDATE ON category_words
+BEGIN
+    INSERT INTO words_trigram(words_trigram, rowid, lemma, surface_form)
+    VALUES (
+        'delete',
+        old.id,
+        (SELECT lemma FROM words WHERE id = old.word_id),
+        old.surface_form
+    );
+    INSERT INTO words_trigram(rowid, lemma, surface_form)
+    VALUES (
+        new.id,
+        (SELECT lemma FROM words WHERE id = new.word_id),
+        new.surface_form
+    );
+END;
+"""
+
+TRIGRAM_LEMMA_UPDATE_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS words_trigram_au
+AFTER UPDATE OF lemma ON words
+BEGIN
+    INSERT INTO words_trigram(words_trigram, rowid, lemma, surface_form)
+    SELECT
+        'delete',
+        cw.id,
+        old.lemma,
+        cw.surface_form
+    FROM category_words cw
+    WHERE cw.word_id = old.id;
+    INSERT INTO words_trigram(rowid, lemma, surface_form)
+    SELECT cw.id, new.lemma, cw.surface_form
+    FROM category_words cw
+    WHERE cw.word_id = new.id;
+END;
+"""
+
+TRIGRAM_TRIGGERS_SQL = "\n".join(
+    (
+        TRIGRAM_INSERT_TRIGGER_SQL,
+        TRIGRAM_DELETE_TRIGGER_SQL,
+        TRIGRAM_UPDATE_TRIGGER_SQL,
+        TRIGRAM_LEMMA_UPDATE_TRIGGER_SQL,
+    )
+)
+
+# Triggers dropped while a bulk merge fills category_words; the index is then
+# rebuilt in one pass instead of once per inserted or updated row.
+FTS_DEFERRED_TRIGGERS = {
+    "category_words_ai": FTS_INSERT_TRIGGER_SQL,
+    "category_words_au": FTS_UPDATE_TRIGGER_SQL,
+}
+TRIGRAM_DEFERRED_TRIGGERS = {
+    "category_words_trigram_ai": TRIGRAM_INSERT_TRIGGER_SQL,
+    "category_words_trigram_au": TRIGRAM_UPDATE_TRIGGER_SQL,
+}
+FTS_BULK_REBUILD_MIN_ROWS = 2000
+
+MERGE_STAGE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS merge_stage (
+    category_id INTEGER NOT NULL,
+    lemma TEXT NOT NULL,
+    surface_form TEXT NOT NULL,
+    UNIQUE(category_id, lemma)
+);
+"""
+
+# Stage rows are sent as multi-row VALUES statements; 200 rows keeps each one at
+# 600 bound variables, well under SQLITE_MAX_VARIABLE_NUMBER.
+MERGE_STAGE_CHUNK_ROWS = 200
+
+MERGE_COUNT_NEW_SQL = """
+SELECT s.category_id, COUNT(1)
+FROM temp.merge_stage s
+JOIN words w ON w.lemma = s.lemma
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM category_words cw
+    WHERE cw.category_id = s.category_id AND cw.word_id = w.id
+)
+GROUP BY s.category_id
+"""
+
+MERGE_INSERT_NEW_SQL = """
+INSERT INTO category_words(category_id, word_id, surface_form, source)
+SELECT s.category_id, w.id, s.surface_form, ?
+FROM temp.merge_stage s
+JOIN words w ON w.lemma = s.lemma
+WHERE true
+ORDER BY s.rowid
+ON CONFLICT(category_id, word_id) DO NOTHING
+"""
+
+# One pass over the stage both inserts new rows and backfills existing ones,
+# instead of a separate UPDATE join followed by the insert.
+MERGE_UPSERT_SQL = """
+INSERT INTO category_words(category_id, word_id, surface_form, source)
+SELECT s.category_id, w.id, s.surface_form, ?
+FROM temp.merge_stage s
+JOIN words w ON w.lemma = s.lemma
+WHERE true
+ORDER BY s.rowid
+ON CONFLICT(category_id, word_id) DO UPDATE
+SET surface_form = COALESCE(
+        NULLIF(category_words.surface_form, ''), excluded.surface_form
+    ),
+    source = COALESCE(category_words.source, excluded.source)
+WHERE category_words.surface_form IS NULL
+   OR category_words.surface_form = ''
+   OR category_words.source IS NULL
+"""
+
+CATEGORY_WORDS_SQL = """
+SELECT cw.surface_form
+FROM category_words cw
+JOIN words w ON w.id = cw.word_id
+WHERE cw.category_id = ?
+ORDER BY cw.surface_form COLLATE NOCASE, w.lemma
+"""
+
+KNOWN_LEMMAS_SQL = """
+SELECT w.lemma
+FROM category_words cw
+JOIN words w ON w.id = cw.word_id
+WHERE cw.category_id = ?
+  AND cw.source IS NOT NULL
+  AND cw.surface_form != ''
+"""
+
 MIGRATION_SCHEMA_SQL = """
 CREATE TABLE words_new (
     id INTEGER PRIMARY KEY,
@@ -130,16 +324,78 @@ CREATE TABLE category_words_new (
 """
 
 
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
 class SQLiteVocabularyStorage(VocabularyStorage):
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+    ):
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {journal_mode}")
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported synchronous mode: {synchronous}")
         self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
         self._category_ids: dict[str, int] = {}
+        self._known_lemmas: dict[int, set[str]] = {}
+        self._known_version: tuple[int, int] | None = None
         self._fts_available = False
+        self._trigram_available = False
+        # PRAGMA data_version of the shared connection when it last held rows;
+        # it only moves when another connection commits, e.g. the DB editor.
+        self._nonempty_version: int | None = None
+        self._conn = None
+        self._conn_lock = threading.RLock()
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        if self._conn is None:
+            self._conn = self._open_connection(check_same_thread=False)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self, *, immediate: bool = False):
+        # One connection is shared by every call, so pragmas, the schema and
+        # SQLite's page cache survive between them; the lock serializes threads.
+        with self._conn_lock:
+            conn = self._connect()
+            with conn:
+                if immediate:
+                    # Take the write lock up front rather than upgrading from a
+                    # read lock mid-merge, which can fail with SQLITE_BUSY.
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+
+    def close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._nonempty_version = None
+                self._known_version = None
+
+    def _open_connection(self, **kwargs) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, **kwargs)
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
     def _load_category_ids(self, conn: sqlite3.Connection) -> None:
@@ -148,7 +404,7 @@ class SQLiteVocabularyStorage(VocabularyStorage):
 
     def _ensure_schema(self) -> None:
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
-        with self._connect() as conn:
+        with self._transaction() as conn:
             conn.executescript(CATEGORIES_SQL)
             if self._needs_migration(conn):
                 self._migrate_schema(conn)
@@ -175,13 +431,40 @@ class SQLiteVocabularyStorage(VocabularyStorage):
             raise
         self._fts_available = True
         if not existing:
-            self._rebuild_fts(conn)
+            self._rebuild_fts_table(conn, "words_fts")
+        self._ensure_trigram(conn)
+
+    def _ensure_trigram(self, conn: sqlite3.Connection) -> None:
+        existing = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'words_trigram'"
+        ).fetchone()
+        try:
+            conn.executescript(TRIGRAM_SCHEMA_SQL)
+            conn.executescript(TRIGRAM_TRIGGERS_SQL)
+        except sqlite3.OperationalError as exc:
+            if "tokenizer" not in str(exc).lower():
+                raise
+            self._trigram_available = False
+            return
+        self._trigram_available = True
+        if not existing:
+            self._rebuild_fts_table(conn, "words_trigram")
+
+    def _deferred_fts_triggers(self) -> dict[str, str]:
+        if not self._trigram_available:
+            return FTS_DEFERRED_TRIGGERS
+        return {**FTS_DEFERRED_TRIGGERS, **TRIGRAM_DEFERRED_TRIGGERS}
 
     def _rebuild_fts(self, conn: sqlite3.Connection) -> None:
-        conn.execute("INSERT INTO words_fts(words_fts) VALUES ('delete-all')")
+        self._rebuild_fts_table(conn, "words_fts")
+        if self._trigram_available:
+            self._rebuild_fts_table(conn, "words_trigram")
+
+    def _rebuild_fts_table(self, conn: sqlite3.Connection, table: str) -> None:
+        conn.execute(f"INSERT INTO {table}({table}) VALUES ('delete-all')")
         conn.execute(
-            """
-            INSERT INTO words_fts(rowid, lemma, surface_form)
+            f"""
+            INSERT INTO {table}(rowid, lemma, surface_form)
             SELECT cw.id, w.lemma, cw.surface_form
             FROM category_words cw
             JOIN words w ON w.id = cw.word_id
@@ -189,20 +472,16 @@ class SQLiteVocabularyStorage(VocabularyStorage):
         )
 
     def _prepare_words(self, words: Iterable[str]) -> list[tuple[str, str]]:
-        prepared = []
-        seen = set()
+        # Deduped by lemma here so repeats never reach the stage; setdefault keeps
+        # the first surface form, as the stage's UNIQUE(category_id, lemma) did.
+        prepared = {}
         for word in words or []:
             if not isinstance(word, str):
                 continue
             cleaned = word.strip()
-            if not cleaned:
-                continue
-            lemma = cleaned.casefold()
-            if lemma in seen:
-                continue
-            seen.add(lemma)
-            prepared.append((lemma, cleaned))
-        return prepared
+            if cleaned:
+                prepared.setdefault(cleaned.casefold(), cleaned)
+        return list(prepared.items())
 
     def _get_category_id(self, conn: sqlite3.Connection, category: str) -> int:
         cached = self._category_ids.get(category)
@@ -217,46 +496,55 @@ class SQLiteVocabularyStorage(VocabularyStorage):
             return row[0]
         raise ValueError(f"Unknown category: {category}")
 
-    def _fetch_word_ids(
-        self, conn: sqlite3.Connection, lemma_values: list[str]
-    ) -> dict[str, int]:
-        if not lemma_values:
-            return {}
-        result = {}
-        for chunk in _chunked(lemma_values, 900):
-            placeholders = ",".join("?" for _ in chunk)
-            query = f"SELECT id, lemma FROM words WHERE lemma IN ({placeholders})"
-            for row in conn.execute(query, chunk):
-                result[row[1]] = row[0]
-        return result
-
     def is_empty(self) -> bool:
-        with self._connect() as conn:
+        with self._transaction() as conn:
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._nonempty_version:
+                return False
             row = conn.execute("SELECT 1 FROM category_words LIMIT 1").fetchone()
+            self._nonempty_version = None if row is None else version
         return row is None
 
     def get_categories(self) -> list[str]:
         if self._category_ids:
             return sorted(self._category_ids.keys())
-        with self._connect() as conn:
+        with self._transaction() as conn:
             rows = conn.execute("SELECT name FROM categories ORDER BY name").fetchall()
         return [row[0] for row in rows]
 
     def get_words_by_category(self) -> dict[str, list[str]]:
+        # One query per category walks idx_category_words_category_surface_word
+        # in order, instead of sorting every row of the table at once.
         words_by_category = {category: [] for category in LEXICAL_CATEGORIES}
-        with self._connect() as conn:
-            rows = conn.execute(
+        with self._transaction() as conn:
+            for category, category_id in sorted(self._category_ids.items()):
+                words_by_category[category] = [
+                    row[0] for row in conn.execute(CATEGORY_WORDS_SQL, (category_id,))
+                ]
+        return words_by_category
+
+    def iter_word_grid(self) -> Iterator[tuple[int, str, str]]:
+        # Streams on its own connection so a slow consumer doesn't hold the
+        # shared connection's lock; WAL lets it read alongside writers.
+        conn = self._open_connection()
+        try:
+            yield from conn.execute(
                 """
-                SELECT c.name, cw.surface_form, w.lemma
+                SELECT
+                    ROW_NUMBER() OVER (
+                        PARTITION BY cw.category_id
+                        ORDER BY cw.surface_form COLLATE NOCASE, w.lemma
+                    ) - 1 AS row_index,
+                    c.name,
+                    cw.surface_form
                 FROM category_words cw
                 JOIN categories c ON c.id = cw.category_id
                 JOIN words w ON w.id = cw.word_id
-                ORDER BY c.name, cw.surface_form COLLATE NOCASE, w.lemma
+                ORDER BY row_index, cw.category_id
                 """
-            ).fetchall()
-        for category, surface_form, _lemma in rows:
-            words_by_category.setdefault(category, []).append(surface_form)
-        return words_by_category
+            )
+        finally:
+            conn.close()
 
     def get_words(
         self,
@@ -266,7 +554,7 @@ class SQLiteVocabularyStorage(VocabularyStorage):
         limit: int | None = None,
         offset: int = 0,
     ) -> list[str]:
-        with self._connect() as conn:
+        with self._transaction() as conn:
             category_id = self._get_category_id(conn, category)
             params = [category_id]
             search_clause = ""
@@ -283,8 +571,43 @@ class SQLiteVocabularyStorage(VocabularyStorage):
                                 limit=limit,
                                 offset=offset,
                             )
-                    search_clause = " AND (w.lemma LIKE ? OR cw.surface_form LIKE ?)"
-                    params.extend([f"%{normalized}%", f"%{normalized}%"])
+                    if (
+                        self._trigram_available
+                        and len(normalized) >= _TRIGRAM_MIN_LENGTH
+                        and not _FTS_TOKEN_RE.fullmatch(normalized)
+                    ):
+                        return self._get_words_fts(
+                            conn,
+                            category_id,
+                            _build_phrase_query(normalized),
+                            limit=limit,
+                            offset=offset,
+                            table="words_trigram",
+                        )
+                    if _FTS_TOKEN_RE.fullmatch(normalized):
+                        # Token-prefix match like the FTS path: a range on the
+                        # casefolded lemma covers the first word, LIKE the
+                        # words after a space in multi-word entries.
+                        prefix = normalized.casefold()
+                        pattern = _escape_like(normalized)
+                        search_clause = (
+                            " AND ((w.lemma >= ? AND w.lemma < ?)"
+                            " OR w.lemma LIKE ? ESCAPE '\\'"
+                            " OR cw.surface_form LIKE ? ESCAPE '\\'"
+                            " OR cw.surface_form LIKE ? ESCAPE '\\')"
+                        )
+                        params.extend(
+                            [
+                                prefix,
+                                prefix + _MAX_CODE_POINT,
+                                f"% {_escape_like(prefix)}%",
+                                f"{pattern}%",
+                                f"% {pattern}%",
+                            ]
+                        )
+                    else:
+                        search_clause = " AND (w.lemma LIKE ? OR cw.surface_form LIKE ?)"
+                        params.extend([f"%{normalized}%", f"%{normalized}%"])
 
             limit_clause = ""
             if limit is not None:
@@ -313,6 +636,7 @@ class SQLiteVocabularyStorage(VocabularyStorage):
         *,
         limit: int | None,
         offset: int,
+        table: str = "words_fts",
     ) -> list[str]:
         params = [category_id, fts_query]
         limit_clause = ""
@@ -325,10 +649,10 @@ class SQLiteVocabularyStorage(VocabularyStorage):
 
         query = f"""
             SELECT cw.surface_form
-            FROM words_fts
-            JOIN category_words cw ON cw.id = words_fts.rowid
+            FROM {table}
+            JOIN category_words cw ON cw.id = {table}.rowid
             JOIN words w ON w.id = cw.word_id
-            WHERE cw.category_id = ? AND words_fts MATCH ?
+            WHERE cw.category_id = ? AND {table} MATCH ?
             ORDER BY cw.surface_form COLLATE NOCASE, w.lemma
             {limit_clause}
         """
@@ -336,146 +660,164 @@ class SQLiteVocabularyStorage(VocabularyStorage):
         return [row[0] for row in rows]
 
     def add_words(self, category: str, words: Iterable[str], source: str | None = None) -> int:
-        return self._insert_words(category, words, source=source, update_existing=False)
+        counts = self._merge_categories(
+            {category: words}, source=source, update_existing=False
+        )
+        return counts[category]
 
     def merge_words(
         self, category: str, words: Iterable[str], source: str | None = None
     ) -> int:
-        return self._insert_words(category, words, source=source, update_existing=True)
+        counts = self._merge_categories(
+            {category: words}, source=source, update_existing=True
+        )
+        return counts[category]
 
     def merge_categories(
         self, category_word_map: dict[str, Iterable[str]], source: str | None = None
     ) -> dict[str, int]:
         if not isinstance(category_word_map, dict):
             raise TypeError("category_word_map must be a dict of category -> words")
+        return self._merge_categories(
+            category_word_map, source=source, update_existing=True
+        )
+
+    def _merge_categories(
+        self,
+        category_word_map: dict[str, Iterable[str]],
+        *,
+        source: str | None,
+        update_existing: bool,
+    ) -> dict[str, int]:
         counts = {category: 0 for category in category_word_map}
         if not category_word_map:
             return counts
 
         prepared_by_category = {}
-        all_lemmas = set()
         for category, words in category_word_map.items():
             prepared = self._prepare_words(words)
-            if not prepared:
-                continue
-            prepared_by_category[category] = prepared
-            all_lemmas.update(lemma for lemma, _ in prepared)
+            if prepared:
+                prepared_by_category[category] = prepared
 
         if not prepared_by_category:
             return counts
 
-        with self._connect() as conn:
-            for category in prepared_by_category:
-                self._get_category_id(conn, category)
-
-            conn.executemany(
-                "INSERT OR IGNORE INTO words(lemma) VALUES (?)",
-                [(lemma,) for lemma in all_lemmas],
-            )
-
-            word_ids = self._fetch_word_ids(conn, list(all_lemmas))
-
+        with self._transaction(immediate=True) as conn:
+            category_ids = {
+                category: self._get_category_id(conn, category)
+                for category in prepared_by_category
+            }
+            known = self._take_known_lemmas(conn, list(category_ids.values()))
+            stage_rows = []
             for category, prepared in prepared_by_category.items():
-                category_id = self._category_ids[category]
-                rows = [
-                    (category_id, word_ids[lemma], surface, source)
+                category_id = category_ids[category]
+                known_lemmas = known[category_id]
+                stage_rows.extend(
+                    (category_id, lemma, surface)
                     for lemma, surface in prepared
-                ]
-
-                insert_cursor = conn.executemany(
-                    """
-                    INSERT OR IGNORE INTO category_words(
-                        category_id, word_id, surface_form, source
-                    ) VALUES (?, ?, ?, ?)
-                    """,
-                    rows,
+                    if lemma not in known_lemmas
                 )
-                counts[category] = max(insert_cursor.rowcount, 0)
-
-                conn.executemany(
-                    """
-                    UPDATE category_words
-                    SET surface_form = COALESCE(NULLIF(surface_form, ''), ?),
-                        source = COALESCE(source, ?)
-                    WHERE category_id = ? AND word_id = ?
-                      AND (surface_form IS NULL OR surface_form = '' OR source IS NULL)
-                    """,
-                    [
-                        (surface, source, category_id, word_ids[lemma])
-                        for lemma, surface in prepared
-                    ],
+            if stage_rows:
+                defer_fts = self._should_defer_fts(conn, len(stage_rows))
+                if defer_fts:
+                    deferred_triggers = self._deferred_fts_triggers()
+                    for trigger in deferred_triggers:
+                        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                self._merge_staged(
+                    conn,
+                    stage_rows,
+                    category_ids,
+                    counts,
+                    source=source,
+                    update_existing=update_existing,
                 )
+                if defer_fts:
+                    # Still inside the merge transaction, so a failure rolls the
+                    # dropped triggers back along with the rows.
+                    for trigger_sql in deferred_triggers.values():
+                        conn.execute(trigger_sql)
+                    self._rebuild_fts(conn)
+                # Only the upsert backfills existing rows; add_words leaves a
+                # NULL source in place, so those lemmas are not known yet.
+                if source is not None and update_existing:
+                    for category_id, lemma, _surface in stage_rows:
+                        known[category_id].add(lemma)
+            version = self._write_version(conn)
+        if any(counts.values()):
+            self._mark_nonempty()
+        self._known_version = version
+        self._known_lemmas.update(known)
 
         return counts
 
-    def _insert_words(
-        self,
-        category: str,
-        words: Iterable[str],
-        *,
-        source: str | None,
-        update_existing: bool,
-    ) -> int:
-        with self._connect() as conn:
-            return self._insert_words_with_connection(
-                conn,
-                category,
-                words,
-                source=source,
-                update_existing=update_existing,
-            )
+    def _mark_nonempty(self) -> None:
+        with self._transaction() as conn:
+            self._nonempty_version = conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _should_defer_fts(self, conn: sqlite3.Connection, stage_count: int) -> bool:
+        # A full rebuild only beats per-row triggers when the merge is large
+        # compared with what is already indexed, e.g. a first import.
+        if not self._fts_available or stage_count < FTS_BULK_REBUILD_MIN_ROWS:
+            return False
+        (existing,) = conn.execute("SELECT COUNT(1) FROM category_words").fetchone()
+        return stage_count >= existing
 
-    def _insert_words_with_connection(
+    def _merge_staged(
         self,
         conn: sqlite3.Connection,
-        category: str,
-        words: Iterable[str],
+        stage_rows: list[tuple[int, str, str]],
+        category_ids: dict[str, int],
+        counts: dict[str, int],
         *,
         source: str | None,
         update_existing: bool,
-    ) -> int:
-        prepared = self._prepare_words(words)
-        if not prepared:
-            return 0
-
-        category_id = self._get_category_id(conn, category)
-        conn.executemany(
-            "INSERT OR IGNORE INTO words(lemma) VALUES (?)",
-            [(lemma,) for lemma, _ in prepared],
-        )
-
-        word_ids = self._fetch_word_ids(conn, [lemma for lemma, _ in prepared])
-        rows = [
-            (category_id, word_ids[lemma], surface, source)
-            for lemma, surface in prepared
-        ]
-
-        insert_cursor = conn.executemany(
-            """
-            INSERT OR IGNORE INTO category_words(
-                category_id, word_id, surface_form, source
-            ) VALUES (?, ?, ?, ?)
-            """,
-            rows,
-        )
-        added = max(insert_cursor.rowcount, 0)
-
-        if update_existing:
-            conn.executemany(
+    ) -> None:
+        conn.execute(MERGE_STAGE_SQL)
+        try:
+            for start in range(0, len(stage_rows), MERGE_STAGE_CHUNK_ROWS):
+                chunk = stage_rows[start : start + MERGE_STAGE_CHUNK_ROWS]
+                conn.execute(
+                    _stage_insert_sql(len(chunk)), list(chain.from_iterable(chunk))
+                )
+            conn.execute(
+                """
+                INSERT INTO words(lemma)
+                SELECT DISTINCT lemma FROM temp.merge_stage WHERE true
+                ON CONFLICT(lemma) DO NOTHING
                 """
-                UPDATE category_words
-                SET surface_form = COALESCE(NULLIF(surface_form, ''), ?),
-                    source = COALESCE(source, ?)
-                WHERE category_id = ? AND word_id = ?
-                  AND (surface_form IS NULL OR surface_form = '' OR source IS NULL)
-                """,
-                [
-                    (surface, source, category_id, word_ids[lemma])
-                    for lemma, surface in prepared
-                ],
             )
 
-        return added
+            names_by_id = {
+                category_id: category for category, category_id in category_ids.items()
+            }
+            for category_id, added in conn.execute(MERGE_COUNT_NEW_SQL):
+                counts[names_by_id[category_id]] = added
+
+            merge_sql = MERGE_UPSERT_SQL if update_existing else MERGE_INSERT_NEW_SQL
+            conn.execute(merge_sql, (source,))
+        finally:
+            conn.execute("DELETE FROM temp.merge_stage")
+
+    @staticmethod
+    def _write_version(conn: sqlite3.Connection) -> tuple[int, int]:
+        # data_version moves when another connection commits (e.g. the DB
+        # editor) and total_changes when this one writes outside a merge.
+        return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+    def _take_known_lemmas(
+        self, conn: sqlite3.Connection, category_ids: list[int]
+    ) -> dict[int, set[str]]:
+        # Entries are removed while a merge runs, so a failed transaction
+        # leaves them invalidated instead of holding uncommitted lemmas.
+        if self._write_version(conn) != self._known_version:
+            self._known_lemmas.clear()
+        known = {}
+        for category_id in category_ids:
+            cached = self._known_lemmas.pop(category_id, None)
+            if cached is None:
+                cached = {row[0] for row in conn.execute(KNOWN_LEMMAS_SQL, (category_id,))}
+            known[category_id] = cached
+        return known
 
     def _needs_migration(self, conn: sqlite3.Connection) -> bool:
         words_cols = _table_columns(conn, "words")
@@ -552,11 +894,6 @@ class SQLiteVocabularyStorage(VocabularyStorage):
         conn.execute("DROP TABLE words_old")
 
 
-def _chunked(values: list[str], size: int) -> Iterable[list[str]]:
-    for index in range(0, len(values), size):
-        yield values[index : index + size]
-
-
 def _count_category_words(conn: sqlite3.Connection, category_id: int) -> int:
     row = conn.execute(
         "SELECT COUNT(1) FROM category_words WHERE category_id = ?",
@@ -565,6 +902,15 @@ def _count_category_words(conn: sqlite3.Connection, category_id: int) -> int:
     return row[0] if row else 0
 
 
+@lru_cache(maxsize=8)
+def _stage_insert_sql(row_count: int) -> str:
+    values = ", ".join(["(?, ?, ?)"] * row_count)
+    return (
+        "INSERT OR IGNORE INTO temp.merge_stage(category_id, lemma, surface_form) "
+        f"VALUES {values}"
+    )
+
+
 def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
     rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
     return {row[1] for row in rows}
@@ -572,6 +918,8 @@ def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
 
 _FTS_TOKEN_RE = re.compile(r"[\w']+")
 _FTS_MIN_TOKEN_LENGTH = 2
+_MAX_CODE_POINT = "\U0010ffff"
+_TRIGRAM_MIN_LENGTH = 3
 
 
 def _build_fts_query(search: str) -> str | None:
@@ -581,3 +929,12 @@ def _build_fts_query(search: str) -> str | None:
     if any(len(token) < _FTS_MIN_TOKEN_LENGTH for token in tokens):
         return None
     return " AND ".join(f"{token}*" for token in tokens)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _build_phrase_query(search: str) -> str:
+    escaped = search.replace('"', '""')
+    return f'"{escaped}"'
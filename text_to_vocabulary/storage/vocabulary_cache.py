@@ -1,11 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import os
+import pickle
+import sys
+import time
+import weakref
+
+
+STAT_TTL_SECONDS = 0.1
 
 
 @dataclass(frozen=True)
 class CacheEntry:
     signature: tuple[float, int] | None
-    words: list[str]
+    words: tuple[str, ...]
+    rows_xml: bytes | None = None
+    word_set: frozenset[str] | None = None
 
 
 def _stat_signature(path):
@@ -16,19 +25,101 @@ def _stat_signature(path):
     return (stats.st_mtime, stats.st_size)
 
 
+def _freeze_words(words):
+    # Cached word lists are shared and long-lived; interning lets the same word
+    # loaded from several files point at one string.
+    return tuple(map(sys.intern, words))
+
+
+def _load_entries(persist_to):
+    try:
+        with open(persist_to, "rb") as handle:
+            entries = pickle.load(handle)
+    except Exception:
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        path: entry
+        for path, entry in entries.items()
+        if isinstance(entry, CacheEntry)
+        and entry.signature is not None
+        and entry.signature == _stat_signature(path)
+    }
+
+
+def _save_entries(persist_to, entries):
+    temp_path = f"{persist_to}.tmp"
+    try:
+        with open(temp_path, "wb") as handle:
+            pickle.dump(entries, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, persist_to)
+    except OSError:
+        pass
+
+
 class VocabularyCache:
-    def __init__(self):
-        self._entries = {}
+    def __init__(self, *, stat_ttl=STAT_TTL_SECONDS, persist_to=None):
+        self._entries = _load_entries(persist_to) if persist_to else {}
+        self._stat_ttl = stat_ttl
+        self._signatures = {}
+        self._persist_to = persist_to
+        if persist_to:
+            # Entries whose file changed between runs were dropped on load;
+            # whatever is cached at exit is written back for the next run.
+            weakref.finalize(self, _save_entries, persist_to, self._entries)
 
-    def get_words(self, path, loader):
+    def save(self):
+        if self._persist_to:
+            _save_entries(self._persist_to, self._entries)
+
+    def _signature(self, path, *, fresh=False):
+        # Repeated lookups of the same file within stat_ttl share one os.stat;
+        # writes through this cache pass fresh=True so they are never stale.
+        now = time.monotonic()
+        checked = self._signatures.get(path)
+        if not fresh and checked and now - checked[0] < self._stat_ttl:
+            return checked[1]
         signature = _stat_signature(path)
+        self._signatures[path] = (now, signature)
+        return signature
+
+    def get_words(self, path, loader):
+        signature = self._signature(path)
         entry = self._entries.get(path)
         if entry and entry.signature == signature:
             return entry.words
-        words = loader(path)
+        words = _freeze_words(loader(path))
         self._entries[path] = CacheEntry(signature=signature, words=words)
         return words
 
-    def update_words(self, path, words):
-        signature = _stat_signature(path)
-        self._entries[path] = CacheEntry(signature=signature, words=words)
+    def _current_entry(self, path):
+        entry = self._entries.get(path)
+        if entry is None or entry.signature is None:
+            return None
+        if entry.signature != self._signature(path):
+            return None
+        return entry
+
+    def get_rows_xml(self, path):
+        entry = self._current_entry(path)
+        return entry.rows_xml if entry else None
+
+    def get_word_set(self, path):
+        entry = self._current_entry(path)
+        if entry is None:
+            return None
+        if entry.word_set is None:
+            word_set = frozenset(map(str.strip, entry.words)) - {""}
+            entry = replace(entry, word_set=word_set)
+            self._entries[path] = entry
+        return entry.word_set
+
+    def update_words(self, path, words, rows_xml=None, word_set=None):
+        signature = self._signature(path, fresh=True)
+        self._entries[path] = CacheEntry(
+            signature=signature,
+            words=_freeze_words(words),
+            rows_xml=rows_xml,
+            word_set=word_set,
+        )
@@ -28,6 +28,14 @@ class VocabularyStorage(ABC):
     ) -> int:
         raise NotImplementedError
 
+    def merge_categories(
+        self, category_word_map: dict[str, Iterable[str]], source: str | None = None
+    ) -> dict[str, int]:
+        return {
+            category: self.merge_words(category, words, source=source)
+            for category, words in category_word_map.items()
+        }
+
     @abstractmethod
     def is_empty(self) -> bool:
         raise NotImplementedError
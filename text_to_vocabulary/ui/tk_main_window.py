@@ -1,13 +1,20 @@
 import os
 import threading
+
+try:
+    import tkthread
+except Exception:  # pragma: no cover - optional dependency
+    tkthread = None
+
+if tkthread is not None:
+    # Must run before the first Tk() is created; it makes Tk calls from the
+    # worker threads (after(0, ...) callbacks, editor loads) dispatch straight
+    # to the Tcl thread.
+    tkthread.tkinstall()
+
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-from text_to_vocabulary.app.vocabulary_analysis import (
-    analyze_and_store,
-    export_multiple_files,
-    export_single_file,
-)
 from text_to_vocabulary.config import (
     apply_settings_defaults,
     load_settings,
@@ -15,6 +22,7 @@ from text_to_vocabulary.config import (
 )
 from text_to_vocabulary.domain.vocabulary import LEXICAL_CATEGORIES, format_markdown_table
 from text_to_vocabulary.integrations.llm_cache import LLMResponseCache
+from text_to_vocabulary.integrations.token_budget import prewarm_tokenizer
 from text_to_vocabulary.storage.sqlite_vocabulary_storage import SQLiteVocabularyStorage
 from text_to_vocabulary.ui_db_editor import DatabaseEditorWindow
 
@@ -32,6 +40,7 @@ class VocabularyWindow(tk.Tk):
             messagebox.showerror("Missing settings.json", str(exc))
             self.destroy()
             raise SystemExit(1) from exc
+        prewarm_tokenizer(settings["model"])
 
         self.status_var = tk.StringVar(value="Ready.")
         self.endpoint_var = tk.StringVar(value=settings["endpoint"])
@@ -47,7 +56,9 @@ class VocabularyWindow(tk.Tk):
         self.auto_import_ods = settings["auto_import_ods"]
         self.llm_cache_enabled = settings["llm_cache_enabled"]
         self.llm_cache_max_entries = settings["llm_cache_max_entries"]
+        self.llm_cache_ttl_seconds = settings["llm_cache_ttl_seconds"]
         self.export_in_progress = False
+        self._has_data = False
         self.export_multiple_var = tk.BooleanVar(value=False)
 
         db_path = settings["db_path"]
@@ -64,13 +75,27 @@ class VocabularyWindow(tk.Tk):
         if self.llm_cache_enabled:
             try:
                 self.llm_cache = LLMResponseCache(
-                    db_path, max_entries=self.llm_cache_max_entries
+                    db_path,
+                    max_entries=self.llm_cache_max_entries,
+                    ttl_seconds=self.llm_cache_ttl_seconds,
                 )
             except Exception:
                 self.llm_cache = None
 
         self._build_ui()
         self._update_export_state()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        for resource in (self.llm_cache, self.storage):
+            close = getattr(resource, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception:
+                pass
+        self.destroy()
 
     def _build_ui(self):
         padding = {"padx": 10, "pady": 8}
@@ -181,7 +206,11 @@ class VocabularyWindow(tk.Tk):
 
     def _run_request(self, text, output_dir):
         try:
-            data, added_counts, table, _migration = analyze_and_store(
+            # The analysis/export stack (HTTP client, ODS writers) loads on
+            # first use rather than with the window.
+            from text_to_vocabulary.app import vocabulary_analysis
+
+            data, added_counts, table, _migration = vocabulary_analysis.analyze_and_store(
                 text,
                 endpoint=self.endpoint_var.get().strip(),
                 model=self.model_var.get(),
@@ -220,22 +249,29 @@ class VocabularyWindow(tk.Tk):
         self._update_export_state()
 
     def _update_export_state(self):
-        has_db = os.path.exists(self.storage.db_path)
-        has_data = False
-        if has_db:
-            try:
-                has_data = not self.storage.is_empty()
-            except Exception:
-                has_data = False
-        if self.export_in_progress or not (has_db and has_data):
+        # Analysis only ever adds words, so once data was seen the UI thread
+        # stops querying the database; _on_export still checks before exporting.
+        if not self._has_data:
+            self._has_data = self._storage_has_data()
+        if self.export_in_progress or not self._has_data:
             self.export_button.configure(state="disabled")
         else:
             self.export_button.configure(state="normal")
 
+    def _storage_has_data(self):
+        if not os.path.exists(self.storage.db_path):
+            return False
+        try:
+            return not self.storage.is_empty()
+        except Exception:
+            return False
+
     def _on_export(self):
         if self.export_in_progress:
             return
         if self.storage.is_empty():
+            self._has_data = False
+            self._update_export_state()
             messagebox.showwarning("Nothing to export", "No vocabulary data to export yet.")
             return
 
@@ -274,13 +310,16 @@ class VocabularyWindow(tk.Tk):
 
     def _run_export(self, mode, target):
         try:
+            from text_to_vocabulary.app import vocabulary_analysis
+
             if mode == "single":
-                _result, message = export_single_file(
+                _result, message = vocabulary_analysis.export_single_file(
                     storage=self.storage,
                     file_path=target,
+                    progress=self._report_export_progress,
                 )
             else:
-                _result, message = export_multiple_files(
+                _result, message = vocabulary_analysis.export_multiple_files(
                     storage=self.storage,
                     output_dir=target,
                 )
@@ -288,6 +327,9 @@ class VocabularyWindow(tk.Tk):
         except Exception as exc:
             self.after(0, lambda: self._on_export_error(str(exc)))
 
+    def _report_export_progress(self, rows_written):
+        self.after(0, lambda: self.status_var.set(f"Exporting ODS... {rows_written} rows"))
+
     def _on_export_success(self, message):
         self.export_in_progress = False
         self.status_var.set("Exported.")
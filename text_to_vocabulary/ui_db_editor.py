@@ -1,10 +1,14 @@
 import os
 import sqlite3
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 from text_to_vocabulary.db_manager import DatabaseManager, quote_identifier
 
+LOAD_DEBOUNCE_MS = 50
+SQL_RESULT_PAGE_SIZE = 500
+
 
 class RowEditorDialog(tk.Toplevel):
     def __init__(self, master, table_info, title, values=None):
@@ -78,7 +82,13 @@ class DatabaseEditorWindow(tk.Toplevel):
         self.current_offset = 0
         self.total_rows = 0
         self.row_id_map = {}
-        self.row_data_map = {}
+        self._load_generation = 0
+        self._applied_generation = 0
+        self._pending_load = None
+        self._tree_columns = []
+        self._sql_cursor = None
+        self._sql_width = 0
+        self._sql_row_count = 0
 
         self.status_var = tk.StringVar(value="No database loaded.")
         self.sql_status_var = tk.StringVar(value="")
@@ -185,6 +195,10 @@ class DatabaseEditorWindow(tk.Toplevel):
         run_frame.pack(fill="x", padx=6, pady=(4, 6))
         run_button = ttk.Button(run_frame, text="Run", command=self._on_run_sql)
         run_button.pack(side="left")
+        self.sql_more_button = ttk.Button(
+            run_frame, text="Load more", command=self._on_load_more_sql, state="disabled"
+        )
+        self.sql_more_button.pack(side="left", padx=(6, 0))
         ttk.Label(run_frame, textvariable=self.sql_status_var).pack(side="left", padx=(8, 0))
 
         result_frame = ttk.Frame(parent)
@@ -215,6 +229,8 @@ class DatabaseEditorWindow(tk.Toplevel):
             self.open_database(path)
 
     def open_database(self, path: str):
+        # The open result cursor belongs to the connection being replaced.
+        self._set_sql_cursor(None)
         try:
             if self.db is None:
                 self.db = DatabaseManager(path)
@@ -227,6 +243,8 @@ class DatabaseEditorWindow(tk.Toplevel):
         self.current_table = None
         self.current_offset = 0
         self._clear_table_view()
+        self._populate_sql_results([], [])
+        self.sql_status_var.set("")
         self._load_table_list()
         self._update_status()
 
@@ -235,8 +253,8 @@ class DatabaseEditorWindow(tk.Toplevel):
         tables = []
         if self.db:
             tables = self.db.list_tables()
-            for name in tables:
-                self.table_list.insert("end", name)
+            if tables:
+                self.table_list.insert("end", *tables)
         if not tables:
             return
         if self.current_table in tables:
@@ -259,67 +277,124 @@ class DatabaseEditorWindow(tk.Toplevel):
         self.current_offset = 0
         self._refresh_table()
 
-    def _refresh_table(self):
+    def _refresh_table(self, keyset=None):
         if not self.db or not self.current_table:
             return
+        # Loads run on a worker thread; a newer request makes older results stale.
+        # Starting it after a short delay lets a burst of clicks or key repeats
+        # on the table list and page buttons collapse into the last one.
+        self._load_generation += 1
+        self.status_var.set(f"Loading {self.current_table}...")
+        if self._pending_load is not None:
+            self.after_cancel(self._pending_load)
+        self._pending_load = self.after(
+            LOAD_DEBOUNCE_MS,
+            self._start_load,
+            self._load_generation,
+            self.current_table,
+            self.current_offset,
+            self.page_size,
+            keyset or {},
+        )
+
+    def _start_load(self, *args):
+        self._pending_load = None
+        thread = threading.Thread(target=self._load_rows_worker, args=args, daemon=True)
+        thread.start()
+
+    def _load_rows_worker(self, generation, table, offset, page_size, keyset):
         try:
-            self.table_info = self.db.get_table_info(self.current_table)
-            self.current_columns = [col["name"] for col in self.table_info]
-            self.row_identifier = self.db.get_row_identifier(self.current_table)
-            self.total_rows = self.db.count_rows(self.current_table)
-            if self.total_rows and self.current_offset >= self.total_rows:
-                last_page = (self.total_rows - 1) // self.page_size
-                self.current_offset = last_page * self.page_size
-
-            include_rowid = self.row_identifier is not None and self.row_identifier.kind == "rowid"
+            self.db.sync_schema_cache()
+            table_info = self.db.get_table_info(table)
+            row_identifier = self.db.get_row_identifier(table)
+            total_rows = self.db.count_rows(table)
+            if total_rows and offset >= total_rows:
+                offset = (total_rows - 1) // page_size * page_size
+                keyset = {}
+
+            include_rowid = row_identifier is not None and row_identifier.kind == "rowid"
             order_by = None
-            if self.row_identifier:
-                order_by = "rowid" if self.row_identifier.kind == "rowid" else quote_identifier(
-                    self.row_identifier.column
+            if row_identifier:
+                order_by = "rowid" if row_identifier.kind == "rowid" else quote_identifier(
+                    row_identifier.column
                 )
+            else:
+                keyset = {}
             columns, rows = self.db.fetch_rows(
-                self.current_table,
-                self.page_size,
-                self.current_offset,
+                table,
+                page_size,
+                offset,
                 include_rowid=include_rowid,
                 order_by=order_by,
+                **keyset,
             )
-        except sqlite3.Error as exc:
-            self._handle_db_error(exc, title="Load table failed")
-            return
+            if keyset and not rows:
+                # The neighbouring key vanished under a concurrent edit.
+                columns, rows = self.db.fetch_rows(
+                    table,
+                    page_size,
+                    offset,
+                    include_rowid=include_rowid,
+                    order_by=order_by,
+                )
+            result = (table_info, row_identifier, total_rows, offset, columns, rows)
+            self.after(0, lambda: self._apply_loaded_rows(generation, table, result))
+        except Exception as exc:
+            self.after(0, lambda exc=exc: self._on_load_error(generation, exc))
 
+    def _apply_loaded_rows(self, generation, table, result):
+        if generation != self._load_generation or table != self.current_table:
+            return
+        self._applied_generation = generation
+        table_info, row_identifier, total_rows, offset, columns, rows = result
+        self.table_info = table_info
+        self.current_columns = [col["name"] for col in table_info]
+        self.row_identifier = row_identifier
+        self.total_rows = total_rows
+        self.current_offset = offset
         self._populate_table(columns, rows)
+
         self._update_page_controls()
         self._update_action_state()
         self._update_status()
 
+    def _on_load_error(self, generation, exc):
+        if generation != self._load_generation:
+            return
+        self._applied_generation = generation
+        self._update_status()
+        self._handle_db_error(exc, title="Load table failed")
+
     def _populate_table(self, columns, rows):
         self.table_tree.delete(*self.table_tree.get_children())
-        self.table_tree["columns"] = columns
-        for col in columns:
-            self.table_tree.heading(col, text=col)
-            self.table_tree.column(col, width=140, anchor="w", stretch=True)
-
-        self.row_id_map = {}
-        self.row_data_map = {}
-        for index, row in enumerate(rows):
-            item_id = f"row_{self.current_offset + index}"
-            identifier_value = None
-            if self.row_identifier:
-                if self.row_identifier.kind == "rowid":
-                    identifier_value = row["__rowid__"]
-                else:
-                    identifier_value = row[self.row_identifier.column]
-            self.row_id_map[item_id] = identifier_value
-            self.row_data_map[item_id] = row
-            values = [self._format_value(row[col]) for col in columns]
-            self.table_tree.insert("", "end", iid=item_id, values=values)
+        # Paging within a table keeps its columns, so headings (and any widths
+        # the user dragged) are only rebuilt when the column set changes.
+        if columns != self._tree_columns:
+            self.table_tree["columns"] = columns
+            for col in columns:
+                self.table_tree.heading(col, text=col)
+                self.table_tree.column(col, width=140, anchor="w", stretch=True)
+            self._tree_columns = list(columns)
+
+        self.row_id_map = row_id_map = {}
+        identifier_key = None
+        if self.row_identifier:
+            identifier_key = (
+                "__rowid__" if self.row_identifier.kind == "rowid" else self.row_identifier.column
+            )
+        insert = self._tree_inserter(self.table_tree)
+        fmt = self._format_value
+        for index, row in enumerate(rows, self.current_offset):
+            item_id = f"row_{index}"
+            row_id_map[item_id] = row[identifier_key] if identifier_key is not None else None
+            insert(item_id, [fmt(row[col]) for col in columns])
 
     def _clear_table_view(self):
+        self._load_generation += 1
         self.table_tree.delete(*self.table_tree.get_children())
         self.table_tree["columns"] = []
+        self._tree_columns = []
         self.row_id_map = {}
-        self.row_data_map = {}
         self.current_columns = []
         self.table_info = []
         self.row_identifier = None
@@ -372,17 +447,29 @@ class DatabaseEditorWindow(tk.Toplevel):
             parts.append("Edit/Delete uses rowid")
         self.status_var.set(" | ".join(parts))
 
+    def _page_keyset(self, position, direction):
+        # Neighbouring pages are found from the current page's first/last key;
+        # OFFSET stays for refreshes, where no such key applies.
+        if self._applied_generation != self._load_generation:
+            return None
+        if self.row_identifier is None or not self.row_id_map:
+            return None
+        keys = list(self.row_id_map.values())
+        key = keys[position]
+        return {direction: key} if key is not None else None
+
     def _on_prev_page(self):
         if self.current_offset == 0:
             return
         self.current_offset = max(0, self.current_offset - self.page_size)
-        self._refresh_table()
+        keyset = self._page_keyset(0, "before") if self.current_offset else None
+        self._refresh_table(keyset)
 
     def _on_next_page(self):
         if self.current_offset + self.page_size >= self.total_rows:
             return
         self.current_offset += self.page_size
-        self._refresh_table()
+        self._refresh_table(self._page_keyset(-1, "after"))
 
     def _on_add(self):
         if not self.current_table:
@@ -391,6 +478,7 @@ class DatabaseEditorWindow(tk.Toplevel):
         self.wait_window(dialog)
         if dialog.result is None:
             return
+        self._end_sql_results()
         try:
             self.db.insert_row(self.current_table, dialog.result)
         except sqlite3.Error as exc:
@@ -407,17 +495,28 @@ class DatabaseEditorWindow(tk.Toplevel):
                 "Editing is disabled because this table has no primary key and rowid is unavailable.",
             )
             return
-        selected = self._get_selected_item()
+        selected = self._get_selected_items()
         if not selected:
             return
-        row = self.row_data_map[selected]
+        identifier_value = self.row_id_map[selected[0]]
+        # The page keeps only display strings; the editor starts from the
+        # stored values, re-read by key.
+        try:
+            row = self.db.fetch_row(self.current_table, self.row_identifier, identifier_value)
+        except sqlite3.Error as exc:
+            self._handle_db_error(exc, title="Edit failed")
+            return
+        if row is None:
+            messagebox.showwarning("Row not found", "The selected row no longer exists.")
+            self._refresh_table()
+            return
         values = {col: row[col] for col in self.current_columns}
         dialog = RowEditorDialog(self, self.table_info, f"Edit Row: {self.current_table}", values=values)
         self.wait_window(dialog)
         if dialog.result is None:
             return
+        self._end_sql_results()
         try:
-            identifier_value = self.row_id_map[selected]
             self.db.update_row(self.current_table, dialog.result, self.row_identifier, identifier_value)
         except sqlite3.Error as exc:
             self._handle_db_error(exc, title="Update failed")
@@ -433,17 +532,20 @@ class DatabaseEditorWindow(tk.Toplevel):
                 "Deleting is disabled because this table has no primary key and rowid is unavailable.",
             )
             return
-        selected = self._get_selected_item()
+        selected = self._get_selected_items()
         if not selected:
             return
-        if not messagebox.askyesno(
-            "Confirm delete",
-            "Delete the selected row? This cannot be undone.",
-        ):
+        prompt = (
+            "Delete the selected row? This cannot be undone."
+            if len(selected) == 1
+            else f"Delete the {len(selected)} selected rows? This cannot be undone."
+        )
+        if not messagebox.askyesno("Confirm delete", prompt):
             return
+        self._end_sql_results()
         try:
-            identifier_value = self.row_id_map[selected]
-            self.db.delete_row(self.current_table, self.row_identifier, identifier_value)
+            identifier_values = [self.row_id_map[item] for item in selected]
+            self.db.delete_rows(self.current_table, self.row_identifier, identifier_values)
         except sqlite3.Error as exc:
             self._handle_db_error(exc, title="Delete failed")
             return
@@ -456,42 +558,100 @@ class DatabaseEditorWindow(tk.Toplevel):
         sql = self.sql_text.get("1.0", "end").strip()
         if not sql:
             return
+        self._set_sql_cursor(None)
         try:
-            result = self.db.execute_sql(sql)
+            result = self.db.execute_sql(sql, page_size=SQL_RESULT_PAGE_SIZE)
         except sqlite3.Error as exc:
             self._handle_db_error(exc, title="SQL error")
             return
 
         if result["kind"] == "select":
             self._populate_sql_results(result["columns"], result["rows"])
-            self.sql_status_var.set(f"{result['rowcount']} row(s)")
+            self._set_sql_cursor(result["cursor"])
+            self._update_sql_row_status()
         else:
             self._populate_sql_results([], [])
             self.sql_status_var.set(f"Affected rows: {result['rowcount']}")
-            self._load_table_list()
-            if self.current_table:
+            if result["schema_changed"]:
+                self._load_table_list()
+            elif self.current_table:
                 self._refresh_table()
 
     def _populate_sql_results(self, columns, rows):
+        self._set_sql_cursor(None)
         self.sql_tree.delete(*self.sql_tree.get_children())
         self.sql_tree["columns"] = columns
         for col in columns:
             self.sql_tree.heading(col, text=col)
             self.sql_tree.column(col, width=140, anchor="w", stretch=True)
-        for index, row in enumerate(rows):
-            item_id = f"sql_{index}"
-            values = [self._format_value(row[i]) for i in range(len(columns))]
-            self.sql_tree.insert("", "end", iid=item_id, values=values)
+        self._sql_width = len(columns)
+        self._sql_row_count = 0
+        self._append_sql_rows(rows)
+
+    def _append_sql_rows(self, rows):
+        insert = self._tree_inserter(self.sql_tree)
+        fmt = self._format_value
+        width = self._sql_width
+        start = self._sql_row_count
+        for index, row in enumerate(rows, start):
+            insert(f"sql_{index}", [fmt(value) for value in row[:width]])
+        self._sql_row_count = start + len(rows)
+
+    def _set_sql_cursor(self, cursor):
+        if self._sql_cursor is not None and self._sql_cursor is not cursor:
+            self._sql_cursor.close()
+        self._sql_cursor = cursor
+        self.sql_more_button.configure(state="normal" if cursor is not None else "disabled")
+
+    def _end_sql_results(self):
+        # Writes close a partly read console result on the manager's side.
+        if self._sql_cursor is not None:
+            self._set_sql_cursor(None)
+            self._update_sql_row_status()
+
+    def _update_sql_row_status(self):
+        suffix = "+" if self._sql_cursor is not None else ""
+        self.sql_status_var.set(f"{self._sql_row_count}{suffix} row(s)")
+
+    def _on_load_more_sql(self):
+        cursor = self._sql_cursor
+        if cursor is None or not self.db:
+            return
+        try:
+            rows = self.db.fetch_more(cursor, SQL_RESULT_PAGE_SIZE)
+        except sqlite3.Error as exc:
+            self._set_sql_cursor(None)
+            self._handle_db_error(exc, title="SQL error")
+            return
+        self._append_sql_rows(rows)
+        if len(rows) < SQL_RESULT_PAGE_SIZE:
+            self._set_sql_cursor(None)
+        self._update_sql_row_status()
 
-    def _get_selected_item(self):
+    def _get_selected_items(self):
         selection = self.table_tree.selection()
         if not selection:
             messagebox.showwarning("No selection", "Please select a row first.")
-            return None
-        return selection[0]
+            return []
+        return list(selection)
+
+    @staticmethod
+    def _tree_inserter(tree):
+        # Calls the Tcl command directly; Treeview.insert re-formats its option
+        # dict on every call, which dominates for large pages and SQL results.
+        call = tree.tk.call
+        path = str(tree)
+
+        def insert(item_id, values):
+            call(path, "insert", "", "end", "-id", item_id, "-values", values)
+
+        return insert
 
     @staticmethod
     def _format_value(value):
+        # Runs once per cell; text is the common case and needs no conversion.
+        if type(value) is str:
+            return value
         if value is None:
             return ""
         if isinstance(value, bytes):